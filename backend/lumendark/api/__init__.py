@@ -1,3 +1,3 @@
-from lumendark.api.app import app, create_app
+from lumendark.api.app import create_app, get_app
 
-__all__ = ["app", "create_app"]
+__all__ = ["create_app", "get_app"]
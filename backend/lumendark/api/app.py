@@ -7,18 +7,22 @@ from contextlib import asynccontextmanager
 from typing import Optional
 
 from fastapi import FastAPI
+from pydantic import BaseModel, Field
 
-from lumendark.api.dependencies import get_app_state
+from lumendark.api.ratelimit import TokenBucket
 from lumendark.api.routes import orders, withdrawals, status
 from lumendark.storage.user_store import UserStore
 from lumendark.storage.order_book import OrderBook
 from lumendark.storage.message_store import MessageStore
-from lumendark.queues.message_queue import MessageQueue
+from lumendark.queues.message_queue import MessageQueue, QUEUE_MAXSIZE
 from lumendark.queues.action_queue import ActionQueue
 from lumendark.executor.message_handler import MessageHandler
 from lumendark.executor.action_handler import ActionHandler
 from lumendark.blockchain.client import SorobanClient
-from lumendark.blockchain.event_listener import DepositEventListener
+from lumendark.blockchain.event_listener import (
+    DEPOSIT_TOPIC_FILTERS,
+    DepositEventListener,
+)
 from lumendark.blockchain.transaction import TransactionSubmitter
 from stellar_sdk import Keypair
 
@@ -33,9 +37,24 @@ SOROBAN_RPC_URL = os.environ.get(
     "SOROBAN_RPC_URL",
     "https://soroban-testnet.stellar.org"
 )
+# Concurrent keep-alive connections to the RPC endpoint
+SOROBAN_RPC_POOL_SIZE = int(os.environ.get("SOROBAN_RPC_POOL_SIZE", "20"))
+# Transaction confirmation: give up after this many seconds, and poll at
+# most this often once backoff has grown (tune to the network's ledger time)
+SOROBAN_CONFIRM_TIMEOUT = float(os.environ.get("SOROBAN_CONFIRM_TIMEOUT", "60"))
+SOROBAN_CONFIRM_POLL_INTERVAL = float(os.environ.get("SOROBAN_CONFIRM_POLL_INTERVAL", "2.0"))
 # Admin secret key for signing settlement/withdrawal transactions
 # This should be set via environment variable in production
 ADMIN_SECRET_KEY = os.environ.get("ADMIN_SECRET_KEY")
+# Per-user submission rate limit: sustained requests/second and burst size
+RATE_LIMIT_PER_SECOND = float(os.environ.get("LUMENDARK_RATE_LIMIT_PER_SECOND", "20"))
+RATE_LIMIT_BURST = float(os.environ.get("LUMENDARK_RATE_LIMIT_BURST", "40"))
+
+
+class HealthResponse(BaseModel):
+    """Response for the health check."""
+
+    status: str = Field(..., description="Service health status")
 
 
 def create_app(
@@ -44,6 +63,7 @@ def create_app(
     message_store: Optional[MessageStore] = None,
     message_queue: Optional[MessageQueue] = None,
     action_queue: Optional[ActionQueue] = None,
+    rate_limiter: Optional[TokenBucket] = None,
     run_handlers: bool = True,
 ) -> FastAPI:
     """
@@ -53,8 +73,9 @@ def create_app(
         user_store: UserStore instance (created if not provided)
         order_book: OrderBook instance (created if not provided)
         message_store: MessageStore instance (created if not provided)
-        message_queue: MessageQueue instance (created if not provided)
+        message_queue: MessageQueue instance (created bounded if not provided)
         action_queue: ActionQueue instance (created if not provided)
+        rate_limiter: Per-user TokenBucket for submissions (created if not provided)
         run_handlers: Whether to run the MessageHandler in background
 
     Returns:
@@ -64,10 +85,15 @@ def create_app(
     user_store = user_store or UserStore()
     order_book = order_book or OrderBook()
     message_store = message_store or MessageStore()
-    message_queue = message_queue or MessageQueue()
+    message_queue = message_queue or MessageQueue(maxsize=QUEUE_MAXSIZE)
     action_queue = action_queue or ActionQueue()
+    rate_limiter = rate_limiter or TokenBucket(
+        rate=RATE_LIMIT_PER_SECOND,
+        capacity=RATE_LIMIT_BURST,
+    )
 
     # Store references for cleanup
+    soroban_client: Optional[SorobanClient] = None
     message_handler: Optional[MessageHandler] = None
     action_handler: Optional[ActionHandler] = None
     event_listener: Optional[DepositEventListener] = None
@@ -77,21 +103,17 @@ def create_app(
 
     @asynccontextmanager
     async def lifespan(app: FastAPI):
-        nonlocal message_handler, action_handler, event_listener
+        nonlocal soroban_client, message_handler, action_handler, event_listener
         nonlocal message_handler_task, action_handler_task, listener_task
 
-        # Initialize app state for dependencies
-        app_state = get_app_state()
-        app_state.user_store = user_store
-        app_state.order_book = order_book
-        app_state.message_store = message_store
-        app_state.message_queue = message_queue
-
         if run_handlers:
             # Create Soroban client first (used by both event listener and tx submitter)
             soroban_client = SorobanClient(
                 rpc_url=SOROBAN_RPC_URL,
                 contract_id=ORDERBOOK_CONTRACT_ID,
+                confirm_timeout=SOROBAN_CONFIRM_TIMEOUT,
+                poll_max_delay=SOROBAN_CONFIRM_POLL_INTERVAL,
+                pool_size=SOROBAN_RPC_POOL_SIZE,
             )
 
             # Create and start the message handler
@@ -125,14 +147,14 @@ def create_app(
 
             async def on_deposit(message):
                 """Handle deposit events from blockchain."""
-                message_store.add(message)
-                await message_queue.put(message)
+                await message_store.submit(message, message_queue)
                 logger.info(f"Deposit detected: {message.user_address} {message.payload}")
 
             event_listener = DepositEventListener(
                 client=soroban_client,
                 on_deposit=on_deposit,
                 poll_interval=5.0,  # Poll every 5 seconds
+                topics=DEPOSIT_TOPIC_FILTERS,  # Filter deposits on the RPC side
             )
 
             # Start background tasks
@@ -145,32 +167,25 @@ def create_app(
 
         yield
 
-        # Cleanup
+        # Cleanup: stop all components, then cancel their tasks, concurrently
         if run_handlers:
-            if message_handler:
-                await message_handler.stop()
-            if action_handler:
-                await action_handler.stop()
-            if event_listener:
-                await event_listener.stop()
-            if message_handler_task:
-                message_handler_task.cancel()
-                try:
-                    await message_handler_task
-                except asyncio.CancelledError:
-                    pass
-            if action_handler_task:
-                action_handler_task.cancel()
-                try:
-                    await action_handler_task
-                except asyncio.CancelledError:
-                    pass
-            if listener_task:
-                listener_task.cancel()
-                try:
-                    await listener_task
-                except asyncio.CancelledError:
-                    pass
+            components = (message_handler, action_handler, event_listener)
+            await asyncio.gather(
+                *(c.stop() for c in components if c is not None),
+                return_exceptions=True,
+            )
+
+            tasks = [
+                t
+                for t in (message_handler_task, action_handler_task, listener_task)
+                if t is not None
+            ]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+            if soroban_client:
+                soroban_client.close()
 
             logger.info("MessageHandler, ActionHandler, and event listener stopped")
 
@@ -181,18 +196,32 @@ def create_app(
         lifespan=lifespan,
     )
 
+    # Shared components for route dependencies
+    app.state.user_store = user_store
+    app.state.order_book = order_book
+    app.state.message_store = message_store
+    app.state.message_queue = message_queue
+    app.state.rate_limiter = rate_limiter
+
     # Include routes
     app.include_router(orders.router)
     app.include_router(withdrawals.router)
     app.include_router(status.router)
 
-    @app.get("/health")
-    async def health_check():
+    @app.get("/health", response_model=HealthResponse)
+    async def health_check() -> HealthResponse:
         """Health check endpoint."""
-        return {"status": "healthy"}
+        return HealthResponse(status="healthy")
 
     return app
 
 
-# Default app instance for uvicorn
-app = create_app()
+def get_app() -> FastAPI:
+    """
+    Application factory for uvicorn.
+
+    Run with `uvicorn --factory lumendark.api.app:get_app` so the app is
+    only built by the server process, not as a side effect of importing
+    this module.
+    """
+    return create_app()
@@ -1,59 +1,37 @@
 """FastAPI dependencies for accessing shared state."""
 
-from typing import Optional
+from fastapi import Request
 
+from lumendark.api.ratelimit import TokenBucket
 from lumendark.storage.user_store import UserStore
 from lumendark.storage.order_book import OrderBook
 from lumendark.storage.message_store import MessageStore
 from lumendark.queues.message_queue import MessageQueue
 
+# Shared components are attached to app.state by create_app, so each
+# dependency is a single attribute read on the request's application.
 
-class AppState:
-    """
-    Application state container.
 
-    Holds references to all shared components accessed by API routes.
-    """
-
-    def __init__(self) -> None:
-        self.user_store: Optional[UserStore] = None
-        self.order_book: Optional[OrderBook] = None
-        self.message_store: Optional[MessageStore] = None
-        self.message_queue: Optional[MessageQueue] = None
-
-
-# Global app state instance
-_app_state = AppState()
-
-
-def get_app_state() -> AppState:
-    """Get the global application state."""
-    return _app_state
-
-
-def get_user_store() -> UserStore:
+def get_user_store(request: Request) -> UserStore:
     """FastAPI dependency for UserStore."""
-    if _app_state.user_store is None:
-        raise RuntimeError("UserStore not initialized")
-    return _app_state.user_store
+    return request.app.state.user_store
 
 
-def get_order_book() -> OrderBook:
+def get_order_book(request: Request) -> OrderBook:
     """FastAPI dependency for OrderBook."""
-    if _app_state.order_book is None:
-        raise RuntimeError("OrderBook not initialized")
-    return _app_state.order_book
+    return request.app.state.order_book
 
 
-def get_message_store() -> MessageStore:
+def get_message_store(request: Request) -> MessageStore:
     """FastAPI dependency for MessageStore."""
-    if _app_state.message_store is None:
-        raise RuntimeError("MessageStore not initialized")
-    return _app_state.message_store
+    return request.app.state.message_store
 
 
-def get_message_queue() -> MessageQueue:
+def get_message_queue(request: Request) -> MessageQueue:
     """FastAPI dependency for MessageQueue."""
-    if _app_state.message_queue is None:
-        raise RuntimeError("MessageQueue not initialized")
-    return _app_state.message_queue
+    return request.app.state.message_queue
+
+
+def get_rate_limiter(request: Request) -> TokenBucket:
+    """FastAPI dependency for the per-user submission rate limiter."""
+    return request.app.state.rate_limiter
@@ -0,0 +1,62 @@
+"""Per-user admission control for API submissions."""
+
+import time
+from collections import OrderedDict
+from typing import Callable
+
+
+class TokenBucket:
+    """
+    Token bucket rate limiter keyed by user address.
+
+    Each key holds up to `capacity` tokens that refill at `rate` tokens per
+    second. Buckets are refilled lazily when accessed, so no background task
+    is needed. The least recently used keys are evicted beyond `max_keys`;
+    an evicted key simply starts again with a full bucket.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        max_keys: int = 100_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the rate limiter.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens per key (burst size)
+            max_keys: Maximum number of keys tracked at once
+            clock: Monotonic time source in seconds
+        """
+        self._rate = rate
+        self._capacity = capacity
+        self._max_keys = max_keys
+        self._clock = clock
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    def try_acquire(self, key: str, cost: float = 1.0) -> bool:
+        """
+        Take `cost` tokens from the key's bucket if available.
+
+        Returns:
+            True if the tokens were taken, False if the key is rate limited
+        """
+        now = self._clock()
+        entry = self._buckets.get(key)
+        if entry is None:
+            tokens = self._capacity
+            if len(self._buckets) >= self._max_keys:
+                self._buckets.popitem(last=False)
+        else:
+            tokens, last = entry
+            tokens = min(self._capacity, tokens + (now - last) * self._rate)
+            self._buckets.move_to_end(key)
+
+        allowed = tokens >= cost
+        if allowed:
+            tokens -= cost
+        self._buckets[key] = (tokens, now)
+        return allowed
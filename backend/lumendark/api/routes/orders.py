@@ -1,17 +1,19 @@
 """Order API routes."""
 
-from typing import Optional
+from typing import Literal, Optional
 
 from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from lumendark.api.auth import verify_request_signature
 from lumendark.api.dependencies import (
     get_message_queue,
     get_message_store,
+    get_rate_limiter,
 )
+from lumendark.api.ratelimit import TokenBucket
 from lumendark.models.message import Message
-from lumendark.queues.message_queue import MessageQueue
+from lumendark.queues.message_queue import MessageQueue, QUEUE_PUT_TIMEOUT
 from lumendark.storage.message_store import MessageStore
 
 router = APIRouter(prefix="/orders", tags=["orders"])
@@ -20,7 +22,9 @@ router = APIRouter(prefix="/orders", tags=["orders"])
 class OrderRequest(BaseModel):
     """Request body for placing an order."""
 
-    side: str = Field(..., pattern="^(buy|sell)$", description="Order side: buy or sell")
+    model_config = ConfigDict(extra="forbid")
+
+    side: Literal["buy", "sell"] = Field(..., description="Order side: buy or sell")
     price: str = Field(..., description="Limit price (decimal string)")
     quantity: str = Field(..., description="Order quantity (decimal string)")
 
@@ -34,6 +38,8 @@ class OrderResponse(BaseModel):
 class CancelRequest(BaseModel):
     """Request body for cancelling an order."""
 
+    model_config = ConfigDict(extra="forbid")
+
     order_id: str = Field(..., description="Order ID to cancel")
 
 
@@ -49,6 +55,7 @@ async def submit_order(
     user_address: str = Depends(verify_request_signature),
     message_queue: MessageQueue = Depends(get_message_queue),
     message_store: MessageStore = Depends(get_message_store),
+    rate_limiter: TokenBucket = Depends(get_rate_limiter),
 ) -> OrderResponse:
     """
     Submit a new limit order.
@@ -58,6 +65,12 @@ async def submit_order(
     If the order is accepted and added to the book, the order_id will
     be available in the message status response.
     """
+    if not rate_limiter.try_acquire(user_address):
+        raise HTTPException(
+            status_code=429,
+            detail="Too many requests",
+        )
+
     # Create message
     message = Message.create_order(
         user_address=user_address,
@@ -66,11 +79,13 @@ async def submit_order(
         quantity=order.quantity,
     )
 
-    # Store message for status tracking
-    message_store.add(message)
-
-    # Queue for processing
-    await message_queue.put(message)
+    # Store for status tracking and queue for processing,
+    # shedding load if the queue stays full
+    if not await message_store.submit(message, message_queue, timeout=QUEUE_PUT_TIMEOUT):
+        raise HTTPException(
+            status_code=503,
+            detail="Server busy, retry later",
+        )
 
     return OrderResponse(message_id=message.id)
 
@@ -81,6 +96,7 @@ async def cancel_order(
     user_address: str = Depends(verify_request_signature),
     message_queue: MessageQueue = Depends(get_message_queue),
     message_store: MessageStore = Depends(get_message_store),
+    rate_limiter: TokenBucket = Depends(get_rate_limiter),
 ) -> CancelResponse:
     """
     Cancel an existing order.
@@ -88,16 +104,24 @@ async def cancel_order(
     The cancel request is placed in the message queue for processing.
     Returns a message_id that can be used to track the cancel status.
     """
+    if not rate_limiter.try_acquire(user_address):
+        raise HTTPException(
+            status_code=429,
+            detail="Too many requests",
+        )
+
     # Create message
     message = Message.create_cancel(
         user_address=user_address,
         order_id=cancel.order_id,
     )
 
-    # Store message for status tracking
-    message_store.add(message)
-
-    # Queue for processing
-    await message_queue.put(message)
+    # Store for status tracking and queue for processing,
+    # shedding load if the queue stays full
+    if not await message_store.submit(message, message_queue, timeout=QUEUE_PUT_TIMEOUT):
+        raise HTTPException(
+            status_code=503,
+            detail="Server busy, retry later",
+        )
 
     return CancelResponse(message_id=message.id)
@@ -1,15 +1,19 @@
 """Withdrawal API routes."""
 
-from fastapi import APIRouter, Depends
-from pydantic import BaseModel, Field
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import BaseModel, ConfigDict, Field
 
 from lumendark.api.auth import verify_request_signature
 from lumendark.api.dependencies import (
     get_message_queue,
     get_message_store,
+    get_rate_limiter,
 )
+from lumendark.api.ratelimit import TokenBucket
 from lumendark.models.message import Message
-from lumendark.queues.message_queue import MessageQueue
+from lumendark.queues.message_queue import MessageQueue, QUEUE_PUT_TIMEOUT
 from lumendark.storage.message_store import MessageStore
 
 router = APIRouter(prefix="/withdrawals", tags=["withdrawals"])
@@ -18,7 +22,9 @@ router = APIRouter(prefix="/withdrawals", tags=["withdrawals"])
 class WithdrawalRequest(BaseModel):
     """Request body for a withdrawal."""
 
-    asset: str = Field(..., pattern="^[ab]$", description="Asset to withdraw: a or b")
+    model_config = ConfigDict(extra="forbid")
+
+    asset: Literal["a", "b"] = Field(..., description="Asset to withdraw: a or b")
     amount: str = Field(..., description="Amount to withdraw (decimal string)")
 
 
@@ -34,6 +40,7 @@ async def request_withdrawal(
     user_address: str = Depends(verify_request_signature),
     message_queue: MessageQueue = Depends(get_message_queue),
     message_store: MessageStore = Depends(get_message_store),
+    rate_limiter: TokenBucket = Depends(get_rate_limiter),
 ) -> WithdrawalResponse:
     """
     Request a withdrawal.
@@ -42,6 +49,12 @@ async def request_withdrawal(
     If approved, the funds will be transferred on-chain to the user's wallet.
     Returns a message_id that can be used to track the withdrawal status.
     """
+    if not rate_limiter.try_acquire(user_address):
+        raise HTTPException(
+            status_code=429,
+            detail="Too many requests",
+        )
+
     # Create message
     message = Message.create_withdraw(
         user_address=user_address,
@@ -49,10 +62,12 @@ async def request_withdrawal(
         amount=withdrawal.amount,
     )
 
-    # Store message for status tracking
-    message_store.add(message)
-
-    # Queue for processing
-    await message_queue.put(message)
+    # Store for status tracking and queue for processing,
+    # shedding load if the queue stays full
+    if not await message_store.submit(message, message_queue, timeout=QUEUE_PUT_TIMEOUT):
+        raise HTTPException(
+            status_code=503,
+            detail="Server busy, retry later",
+        )
 
     return WithdrawalResponse(message_id=message.id)
@@ -1,9 +1,10 @@
-from lumendark.blockchain.client import SorobanClient
+from lumendark.blockchain.client import SorobanClient, EventPage
 from lumendark.blockchain.event_listener import DepositEventListener
 from lumendark.blockchain.transaction import TransactionSubmitter
 
 __all__ = [
     "SorobanClient",
+    "EventPage",
     "DepositEventListener",
     "TransactionSubmitter",
 ]
@@ -1,17 +1,49 @@
 """Soroban RPC client for interacting with Stellar network."""
 
+import asyncio
 import logging
-from typing import Optional, Any
+import random
+import time
+from typing import Any, Callable, NamedTuple, Optional, TypeVar
 
 from stellar_sdk import Keypair, Network, SorobanServer, TransactionBuilder, scval
-from stellar_sdk.soroban_rpc import EventFilter, EventFilterType
+from stellar_sdk.client.requests_client import RequestsClient
+from stellar_sdk.soroban_rpc import (
+    EventFilter,
+    EventFilterType,
+    GetTransactionResponse,
+    GetTransactionStatus,
+    SendTransactionStatus,
+)
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 # Testnet configuration
 TESTNET_RPC_URL = "https://soroban-testnet.stellar.org"
 TESTNET_PASSPHRASE = Network.TESTNET_NETWORK_PASSPHRASE
 
+# Default number of keep-alive connections held open to the RPC endpoint.
+# Concurrent RPCs from worker threads each check out their own connection.
+RPC_POOL_SIZE = 20
+
+# Seconds any single RPC may take before it is abandoned
+RPC_TIMEOUT = 10.0
+
+# Transaction confirmation polling: exponential backoff up to a
+# configurable cap, with a little jitter so concurrent pollers spread out
+POLL_BACKOFF_FACTOR = 1.5
+POLL_JITTER = 0.1
+
+
+class EventPage(NamedTuple):
+    """One page of contract events from getEvents."""
+
+    events: list[dict[str, Any]]
+    cursor: str  # Resume point for the next page
+    latest_ledger: int  # Latest ledger known to the RPC server
+
 
 class SorobanClient:
     """
@@ -26,8 +58,17 @@ class SorobanClient:
         network_passphrase: str = TESTNET_PASSPHRASE,
         contract_id: Optional[str] = None,
         admin_secret: Optional[str] = None,
+        confirm_timeout: float = 60.0,
+        poll_initial_delay: float = 0.3,
+        poll_max_delay: float = 2.0,
+        pool_size: int = RPC_POOL_SIZE,
+        rpc_timeout: float = RPC_TIMEOUT,
     ) -> None:
+        self._rpc_timeout = rpc_timeout
         self._rpc_url = rpc_url
+        self._confirm_timeout = confirm_timeout
+        self._poll_initial_delay = poll_initial_delay
+        self._poll_max_delay = poll_max_delay
         self._network_passphrase = network_passphrase
         self._contract_id = contract_id
         self._admin_keypair: Optional[Keypair] = None
@@ -35,7 +76,55 @@ class SorobanClient:
         if admin_secret:
             self._admin_keypair = Keypair.from_secret(admin_secret)
 
-        self._server = SorobanServer(rpc_url)
+        # One pooled HTTP session per client, so every RPC made through it
+        # reuses kept-alive connections instead of a new TCP+TLS handshake
+        self._server = SorobanServer(
+            rpc_url,
+            client=RequestsClient(
+                pool_size=pool_size,
+                request_timeout=rpc_timeout,
+                post_timeout=rpc_timeout,
+            ),
+        )
+
+    @property
+    def server(self) -> SorobanServer:
+        """Shared SorobanServer backed by this client's connection pool."""
+        return self._server
+
+    async def rpc(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run a blocking RPC call in a worker thread with a timeout.
+
+        The HTTP session enforces the same timeout, so an abandoned call
+        also frees its worker thread instead of hanging on a stalled
+        endpoint.
+
+        Args:
+            fn: Blocking callable, typically a SorobanServer or client method
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Whatever fn returns
+
+        Raises:
+            TimeoutError: If the call does not finish within rpc_timeout
+        """
+        try:
+            return await asyncio.wait_for(
+                asyncio.to_thread(fn, *args, **kwargs),
+                timeout=self._rpc_timeout,
+            )
+        except asyncio.TimeoutError:
+            name = getattr(fn, "__name__", repr(fn))
+            raise TimeoutError(
+                f"RPC {name} timed out after {self._rpc_timeout:.0f}s"
+            ) from None
+
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        self._server.close()
 
     @property
     def contract_id(self) -> Optional[str]:
@@ -66,29 +155,70 @@ class SorobanClient:
         """
         Fetch events from the Soroban RPC.
 
+        All topic filters are sent in a single getEvents request, so callers
+        interested in several event types need only one RPC per poll.
+
         Args:
             start_ledger: Ledger to start fetching from
             contract_id: Filter by contract ID (uses default if not specified)
-            topics: Optional topic filters
+            topics: Optional topic filters, each a list of base64 XDR
+                segments (or "*" wildcards); an event matches if any filter does
             limit: Maximum number of events to return
 
         Returns:
             List of event dictionaries
         """
+        return self.get_events_page(
+            start_ledger=start_ledger,
+            contract_id=contract_id,
+            topics=topics,
+            limit=limit,
+        ).events
+
+    def get_events_page(
+        self,
+        start_ledger: Optional[int] = None,
+        cursor: Optional[str] = None,
+        contract_id: Optional[str] = None,
+        topics: Optional[list[list[str]]] = None,
+        limit: int = 100,
+    ) -> EventPage:
+        """
+        Fetch one page of events, returning the cursor to resume from.
+
+        Passing the returned cursor to the next call continues the event
+        stream exactly where this page ended, without re-reading events
+        from ledgers that were already scanned.
+
+        Args:
+            start_ledger: Ledger to start fetching from (ignored if cursor is set)
+            cursor: Paging cursor from a previous call
+            contract_id: Filter by contract ID (uses default if not specified)
+            topics: Optional topic filters (see get_events)
+            limit: Maximum number of events to return
+
+        Returns:
+            EventPage with the events, the cursor for the next page, and
+            the latest ledger reported by the server
+        """
         cid = contract_id or self._contract_id
         if not cid:
             raise ValueError("Contract ID must be specified")
+        if start_ledger is None and cursor is None:
+            raise ValueError("Either start_ledger or cursor must be specified")
 
         filters = [
             EventFilter(
                 event_type=EventFilterType.CONTRACT,
                 contract_ids=[cid],
+                topics=topics,
             )
         ]
 
         response = self._server.get_events(
-            start_ledger=start_ledger,
+            start_ledger=None if cursor else start_ledger,
             filters=filters,
+            cursor=cursor,
             limit=limit,
         )
 
@@ -103,7 +233,11 @@ class SorobanClient:
                 "tx_hash": event.transaction_hash,
             })
 
-        return events
+        return EventPage(
+            events=events,
+            cursor=response.cursor,
+            latest_ledger=response.latest_ledger,
+        )
 
     def build_transaction(
         self,
@@ -127,9 +261,9 @@ class SorobanClient:
             base_fee=base_fee,
         )
 
-    def submit_transaction(self, transaction_xdr: str) -> str:
+    async def submit_transaction(self, transaction_xdr: str) -> str:
         """
-        Submit a signed transaction to the network.
+        Submit a signed transaction to the network and wait for it to apply.
 
         Args:
             transaction_xdr: Signed transaction in XDR format
@@ -137,29 +271,48 @@ class SorobanClient:
         Returns:
             Transaction hash
         """
-        response = self._server.send_transaction(transaction_xdr)
+        response = await self.rpc(self._server.send_transaction, transaction_xdr)
 
-        if response.status == "ERROR":
-            raise RuntimeError(f"Transaction failed: {response.error}")
+        if response.status == SendTransactionStatus.ERROR:
+            raise RuntimeError(f"Transaction failed: {response.error_result_xdr}")
 
-        # Wait for transaction to complete
         tx_hash = response.hash
+        result = await self.wait_for_transaction(tx_hash)
+        if result.status == GetTransactionStatus.FAILED:
+            raise RuntimeError(f"Transaction failed: {result}")
+        return tx_hash
+
+    async def wait_for_transaction(self, tx_hash: str) -> GetTransactionResponse:
+        """
+        Poll for a submitted transaction until it is no longer pending.
 
-        # Poll for result
-        import time
-        for _ in range(30):  # 30 second timeout
-            result = self._server.get_transaction(tx_hash)
-            if result.status == "SUCCESS":
-                return tx_hash
-            elif result.status == "FAILED":
-                raise RuntimeError(f"Transaction failed: {result}")
-            elif result.status == "NOT_FOUND":
-                time.sleep(1)
-                continue
-            else:
-                time.sleep(1)
-
-        raise TimeoutError(f"Transaction {tx_hash} did not complete in time")
+        Each RPC runs in a worker thread and polls are spaced with jittered
+        exponential backoff, so the event loop stays free for other work
+        while the network confirms.
+
+        Args:
+            tx_hash: Hash of the submitted transaction
+
+        Returns:
+            The final transaction result (SUCCESS or FAILED)
+
+        Raises:
+            TimeoutError: If the transaction is still not found after
+                confirm_timeout seconds
+        """
+        deadline = time.monotonic() + self._confirm_timeout
+        delay = self._poll_initial_delay
+        while True:
+            result = await self.rpc(self._server.get_transaction, tx_hash)
+            if result.status != GetTransactionStatus.NOT_FOUND:
+                return result
+            if time.monotonic() >= deadline:
+                raise TimeoutError(
+                    f"Transaction {tx_hash} did not complete "
+                    f"after {self._confirm_timeout:.0f}s"
+                )
+            await asyncio.sleep(delay + random.uniform(0, POLL_JITTER))
+            delay = min(self._poll_max_delay, delay * POLL_BACKOFF_FACTOR)
 
     def simulate_transaction(self, transaction_xdr: str) -> dict[str, Any]:
         """
@@ -1,10 +1,13 @@
 """Deposit event listener for monitoring blockchain events."""
 
 import asyncio
+import functools
 import logging
+from collections import OrderedDict
 from typing import Optional, Callable, Awaitable, Any
 
 from stellar_sdk import scval, Address
+from stellar_sdk import xdr as stellar_xdr
 
 from lumendark.blockchain.client import SorobanClient
 from lumendark.models.message import Message
@@ -13,22 +16,65 @@ logger = logging.getLogger(__name__)
 
 # Event topic for deposits (symbol "deposit")
 DEPOSIT_TOPIC = "deposit"
+# Raw symbol bytes, compared directly against undecoded event topics
+DEPOSIT_TOPIC_BYTES = DEPOSIT_TOPIC.encode()
+
+# getEvents topic filter matching deposit events: the "deposit" symbol
+# followed by any user address, so the RPC drops other contract events
+DEPOSIT_TOPIC_FILTERS = [[scval.to_symbol(DEPOSIT_TOPIC).to_xdr(), "*"]]
+
+# Number of parsed topic ScVals kept for reuse across events
+SCVAL_CACHE_SIZE = 1024
+
+# Upper bound in seconds on the poll delay while the contract is idle
+MAX_POLL_INTERVAL = 30.0
+
+# Number of most recent event IDs remembered for deduplication
+MAX_PROCESSED_EVENTS = 10000
+
+
+@functools.lru_cache(maxsize=SCVAL_CACHE_SIZE)
+def _parse_scval(xdr_b64: str) -> stellar_xdr.SCVal:
+    # Topics repeat across events (every deposit shares the same first
+    # topic), so parse each distinct XDR string once. Callers must not
+    # mutate the returned value.
+    return stellar_xdr.SCVal.from_xdr(xdr_b64)
+
+
+def _decode_symbol(val: Any) -> str:
+    return val.sym.sc_symbol.decode()
+
+
+def _decode_address(val: Any) -> str:
+    return Address.from_xdr_sc_address(val.address).address
+
+
+def _decode_i128(val: Any) -> int:
+    # i128 comes as two parts: signed hi and unsigned lo
+    return (val.i128.hi.int64 << 64) | val.i128.lo.uint64
+
+
+def _decode_vec(val: Any) -> list[Any]:
+    # Elements of types without a decoder fall back to str(), as in
+    # parse_scval_string
+    return [SCVAL_DECODERS.get(item.type.name, str)(item) for item in val.vec.sc_vec]
+
+
+# ScVal decoders keyed by ScVal type name, so decoding is one dict lookup
+SCVAL_DECODERS: dict[str, Callable[[Any], Any]] = {
+    "SCV_SYMBOL": _decode_symbol,
+    "SCV_ADDRESS": _decode_address,
+    "SCV_I128": _decode_i128,
+    "SCV_VEC": _decode_vec,
+}
 
 
 def parse_scval_string(val: Any) -> str:
     """Parse a ScVal into a string representation."""
-    # The value comes as XDR, we need to decode it
-    if hasattr(val, 'sym'):
-        return val.sym
-    elif hasattr(val, 'address'):
-        return str(val.address)
-    elif hasattr(val, 'i128'):
-        # i128 comes as two parts: hi and lo
-        hi = val.i128.hi
-        lo = val.i128.lo
-        # Combine them into a single value
-        return str((hi << 64) | lo)
-    return str(val)
+    decoder = SCVAL_DECODERS.get(val.type.name)
+    if decoder is None:
+        return str(val)
+    return str(decoder(val))
 
 
 def decode_deposit_event(event: dict[str, Any]) -> Optional[dict[str, Any]]:
@@ -49,22 +95,18 @@ def decode_deposit_event(event: dict[str, Any]) -> Optional[dict[str, Any]]:
             return None
 
         # Decode topics from XDR
-        from stellar_sdk import xdr as stellar_xdr
-
         # First topic should be "deposit"
-        topic0 = stellar_xdr.SCVal.from_xdr(topics[0])
+        topic0 = _parse_scval(topics[0])
         if topic0.type.name != "SCV_SYMBOL":
             return None
-        if topic0.sym.sc_symbol.decode() != DEPOSIT_TOPIC:
+        if topic0.sym.sc_symbol != DEPOSIT_TOPIC_BYTES:
             return None
 
         # Second topic is user address
-        topic1 = stellar_xdr.SCVal.from_xdr(topics[1])
+        topic1 = _parse_scval(topics[1])
         if topic1.type.name != "SCV_ADDRESS":
             return None
-        user_address = Address.from_xdr_sc_address(
-            topic1.address
-        ).address
+        user_address = _decode_address(topic1)
 
         # Value is a vec containing (asset_enum, amount)
         value_xdr = stellar_xdr.SCVal.from_xdr(event["value"])
@@ -80,7 +122,7 @@ def decode_deposit_event(event: dict[str, Any]) -> Optional[dict[str, Any]]:
         if asset_val.type.name == "SCV_VEC" and len(asset_val.vec.sc_vec) > 0:
             inner = asset_val.vec.sc_vec[0]
             if inner.type.name == "SCV_SYMBOL":
-                asset_symbol = inner.sym.sc_symbol.decode().lower()
+                asset_symbol = inner.sym.sc_symbol.lower()
             else:
                 return None
         else:
@@ -89,15 +131,13 @@ def decode_deposit_event(event: dict[str, Any]) -> Optional[dict[str, Any]]:
         # Second item is amount (i128)
         amount_val = vec_items[1]
         if amount_val.type.name == "SCV_I128":
-            hi = amount_val.i128.hi.int64
-            lo = amount_val.i128.lo.uint64
-            amount = (hi << 64) | lo
+            amount = _decode_i128(amount_val)
         else:
             return None
 
         return {
             "user_address": user_address,
-            "asset": asset_symbol,
+            "asset": asset_symbol.decode(),
             "amount": str(amount),
             "ledger": event["ledger"],
             "tx_hash": event["tx_hash"],
@@ -113,7 +153,10 @@ class DepositEventListener:
     Listens for deposit events on the orderbook contract.
 
     Polls the Soroban RPC for new events and creates Message
-    objects for processing by the MessageHandler.
+    objects for processing by the MessageHandler. Soroban RPC offers no
+    push subscription, so after the first poll the listener resumes from
+    the getEvents paging cursor and only ever receives events it has not
+    seen yet.
     """
 
     def __init__(
@@ -122,6 +165,7 @@ class DepositEventListener:
         on_deposit: Callable[[Message], Awaitable[None]],
         poll_interval: float = 5.0,
         start_ledger: Optional[int] = None,
+        topics: Optional[list[list[str]]] = None,
     ) -> None:
         """
         Initialize the event listener.
@@ -129,16 +173,23 @@ class DepositEventListener:
         Args:
             client: SorobanClient for RPC communication
             on_deposit: Async callback to process deposit messages
-            poll_interval: Seconds between polls
+            poll_interval: Base seconds between polls; halved while events
+                keep arriving and backed off while the contract is idle
             start_ledger: Ledger to start listening from (defaults to latest)
+            topics: Topic filters fetched together in one getEvents call per
+                poll (defaults to all contract events)
         """
         self._client = client
         self._on_deposit = on_deposit
         self._poll_interval = poll_interval
         self._start_ledger = start_ledger
+        self._topics = topics
         self._running = False
-        self._processed_events: set[str] = set()
+        # Insertion-ordered so the oldest IDs are evicted first in O(1)
+        self._processed_events: OrderedDict[str, None] = OrderedDict()
         self._current_ledger: Optional[int] = None
+        self._cursor: Optional[str] = None
+        self._consecutive_empty = 0
 
     @property
     def current_ledger(self) -> Optional[int]:
@@ -152,7 +203,9 @@ class DepositEventListener:
         if self._start_ledger is not None:
             self._current_ledger = self._start_ledger
         else:
-            self._current_ledger = self._client.get_latest_ledger()
+            self._current_ledger = await self._client.rpc(
+                self._client.get_latest_ledger
+            )
 
         logger.info(
             f"DepositEventListener started from ledger {self._current_ledger}"
@@ -160,8 +213,8 @@ class DepositEventListener:
 
         while self._running:
             try:
-                await self._poll_events()
-                await asyncio.sleep(self._poll_interval)
+                events_found = await self._poll_events()
+                await asyncio.sleep(self._next_poll_delay(events_found))
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -174,18 +227,40 @@ class DepositEventListener:
         """Stop the event listener loop."""
         self._running = False
 
-    async def _poll_events(self) -> None:
-        """Poll for new deposit events."""
+    def _next_poll_delay(self, events_found: int) -> float:
+        """
+        Pick the sleep before the next poll from the last poll's result.
+
+        Polls faster while events are arriving and backs off exponentially,
+        up to MAX_POLL_INTERVAL, after consecutive empty polls.
+        """
+        if events_found:
+            self._consecutive_empty = 0
+            return self._poll_interval / 2
+        self._consecutive_empty += 1
+        backoff = self._poll_interval * 2 ** min(self._consecutive_empty, 3)
+        return min(backoff, MAX_POLL_INTERVAL)
+
+    async def _poll_events(self) -> int:
+        """
+        Poll for new deposit events.
+
+        Returns:
+            Number of events returned by the RPC for this poll
+        """
         if self._current_ledger is None:
-            return
+            return 0
 
         try:
-            events = self._client.get_events(
+            page = await self._client.rpc(
+                self._client.get_events_page,
                 start_ledger=self._current_ledger,
+                cursor=self._cursor,
+                topics=self._topics,
                 limit=100,
             )
 
-            for event in events:
+            for event in page.events:
                 event_id = event["id"]
 
                 # Skip already processed events
@@ -214,23 +289,24 @@ class DepositEventListener:
                 # Process the deposit
                 await self._on_deposit(message)
 
-                # Mark as processed
-                self._processed_events.add(event_id)
+                # Mark as processed, forgetting the oldest ID once full
+                self._processed_events[event_id] = None
+                if len(self._processed_events) > MAX_PROCESSED_EVENTS:
+                    self._processed_events.popitem(last=False)
 
                 # Update current ledger
                 if event["ledger"] >= self._current_ledger:
                     self._current_ledger = event["ledger"] + 1
 
-            # Also update ledger if no events
-            latest = self._client.get_latest_ledger()
-            if latest > self._current_ledger:
-                self._current_ledger = latest
+            # Resume after this page only once every event in it was handled
+            self._cursor = page.cursor
+
+            # Also update ledger if no events, using the latest ledger the
+            # getEvents response already carries instead of a second RPC
+            if page.latest_ledger > self._current_ledger:
+                self._current_ledger = page.latest_ledger
 
-            # Prune old processed events (keep last 10000)
-            if len(self._processed_events) > 10000:
-                # Convert to list, sort by event ID, keep newest
-                sorted_events = sorted(self._processed_events)
-                self._processed_events = set(sorted_events[-5000:])
+            return len(page.events)
 
         except Exception as e:
             logger.error(f"Failed to poll events: {e}")
@@ -1,25 +1,46 @@
 """Transaction submission for withdraw and settle operations."""
 
+import asyncio
 import logging
+from decimal import Decimal
 from typing import Optional
 
 from stellar_sdk import (
+    Account,
+    Address,
+    InvokeHostFunction,
     Keypair,
     TransactionBuilder,
     scval,
-    Address,
+    xdr,
 )
+from stellar_sdk.soroban_rpc import GetTransactionStatus, SendTransactionStatus
 
 from lumendark.blockchain.client import SorobanClient
 
 logger = logging.getLogger(__name__)
 
+# Contract function names, encoded once as the symbols an invocation carries
+FUNCTION_SYMBOLS = {
+    name: xdr.SCSymbol(sc_symbol=name.encode()) for name in ("withdraw", "settle")
+}
+
+# Asset enum in contract: A or B. Built once and shared, since the
+# ScVals are only ever serialized into transactions, never mutated.
+ASSET_SCVALS = {
+    "a": scval.to_enum("A", None),
+    "b": scval.to_enum("B", None),
+}
+
 
 class TransactionSubmitter:
     """
     Submits withdraw and settle transactions to the orderbook contract.
 
-    All transactions are signed by the admin keypair.
+    All transactions are signed by the admin keypair. Submissions are
+    serialized: they share one cached admin account sequence, and the
+    contract requires nonces to land in order, so a submission is only
+    started once the previous one has confirmed or failed.
     """
 
     def __init__(
@@ -39,6 +60,14 @@ class TransactionSubmitter:
         self._client = client
         self._admin_keypair = admin_keypair
         self._contract_id = contract_id
+        # Parsed (and validated) once rather than on every submission
+        self._contract_address = Address(contract_id).to_xdr_sc_address()
+        # Held for a whole submission, from building to confirmation
+        self._submit_lock = asyncio.Lock()
+        # Admin account with its locally tracked sequence number. Building a
+        # transaction advances the sequence, so it is only reloaded after a
+        # submission fails and the local sequence may no longer match.
+        self._admin_account: Optional[Account] = None
 
     async def submit_withdrawal(
         self,
@@ -61,71 +90,18 @@ class TransactionSubmitter:
         """
         logger.info(f"Submitting withdrawal: nonce={nonce} {user} {amount} {asset}")
 
-        # Build the contract call
-        from stellar_sdk import SorobanServer
-        from stellar_sdk.soroban_rpc import Api
-
-        server = SorobanServer(self._client._rpc_url)
-
-        # Load admin account
-        admin_account = server.load_account(self._admin_keypair.public_key)
-
-        # Build transaction with contract invocation
-        builder = TransactionBuilder(
-            source_account=admin_account,
-            network_passphrase=self._client._network_passphrase,
-            base_fee=100,
-        )
-
-        # Add contract invocation for withdraw
         # Contract signature: withdraw(nonce, user, asset, amount)
-        builder.append_invoke_contract_function_op(
-            contract_id=self._contract_id,
-            function_name="withdraw",
-            parameters=[
+        return await self._invoke(
+            "withdraw",
+            [
                 scval.to_uint64(nonce),  # nonce (first param)
                 scval.to_address(user),  # user address
                 self._asset_to_scval(asset),  # asset enum
-                scval.to_int128(int(amount)),  # amount
+                scval.to_int128(int(Decimal(amount))),  # amount
             ],
+            description="Withdrawal",
         )
 
-        builder.set_timeout(30)
-        tx = builder.build()
-
-        # Simulate to get resource estimates
-        sim_response = server.simulate_transaction(tx)
-
-        if sim_response.error:
-            raise RuntimeError(f"Simulation failed: {sim_response.error}")
-
-        # Prepare transaction with simulation results
-        tx = server.prepare_transaction(tx, sim_response)
-
-        # Sign with admin key
-        tx.sign(self._admin_keypair)
-
-        # Submit
-        response = server.send_transaction(tx)
-
-        if response.status == "ERROR":
-            raise RuntimeError(f"Transaction failed: {response.error}")
-
-        tx_hash = response.hash
-
-        # Wait for confirmation (60 seconds for testnet which can be slow)
-        import time
-        for _ in range(60):
-            result = server.get_transaction(tx_hash)
-            if result.status == "SUCCESS":
-                logger.info(f"Withdrawal confirmed: {tx_hash}")
-                return tx_hash
-            elif result.status == "FAILED":
-                raise RuntimeError(f"Withdrawal failed: {result}")
-            time.sleep(1)
-
-        raise TimeoutError(f"Withdrawal {tx_hash} did not confirm after 60s")
-
     async def submit_settlement(
         self,
         nonce: int,
@@ -157,80 +133,117 @@ class TransactionSubmitter:
             f"{buyer} ->{amount_b}B-> {seller}"
         )
 
-        from stellar_sdk import SorobanServer
-
-        server = SorobanServer(self._client._rpc_url)
-
-        # Load admin account
-        admin_account = server.load_account(self._admin_keypair.public_key)
-
-        # Build transaction with contract invocation
-        builder = TransactionBuilder(
-            source_account=admin_account,
-            network_passphrase=self._client._network_passphrase,
-            base_fee=100,
-        )
-
         # Contract signature:
         # settle(nonce, buyer, seller, asset_sold, amount_sold, asset_bought, amount_bought)
         # - asset_sold = A (what seller gives to buyer)
         # - asset_bought = B (what seller receives from buyer)
-        builder.append_invoke_contract_function_op(
-            contract_id=self._contract_id,
-            function_name="settle",
-            parameters=[
+        return await self._invoke(
+            "settle",
+            [
                 scval.to_uint64(nonce),  # nonce (first param)
                 scval.to_address(buyer),  # buyer address
                 scval.to_address(seller),  # seller address
                 self._asset_to_scval("a"),  # asset_sold = A
-                scval.to_int128(int(float(amount_a))),  # amount_sold
+                scval.to_int128(int(Decimal(amount_a))),  # amount_sold
                 self._asset_to_scval("b"),  # asset_bought = B
-                scval.to_int128(int(float(amount_b))),  # amount_bought
+                scval.to_int128(int(Decimal(amount_b))),  # amount_bought
             ],
+            description="Settlement",
         )
 
-        builder.set_timeout(30)
-        tx = builder.build()
-
-        # Simulate to get resource estimates
-        sim_response = server.simulate_transaction(tx)
-
-        if sim_response.error:
-            raise RuntimeError(f"Simulation failed: {sim_response.error}")
-
-        # Prepare transaction with simulation results
-        tx = server.prepare_transaction(tx, sim_response)
-
-        # Sign with admin key
-        tx.sign(self._admin_keypair)
-
-        # Submit
-        response = server.send_transaction(tx)
+    async def _invoke(
+        self,
+        function_name: str,
+        parameters: list[xdr.SCVal],
+        description: str,
+    ) -> str:
+        """
+        Invoke a contract function as the admin and wait for confirmation.
 
-        if response.status == "ERROR":
-            raise RuntimeError(f"Transaction failed: {response.error}")
+        Builds, simulates, prepares, signs and sends the transaction, then
+        polls until it is applied.
 
-        tx_hash = response.hash
+        Args:
+            function_name: Contract function to call
+            parameters: Function arguments as ScVals
+            description: Human-readable name used in logs and errors
 
-        # Wait for confirmation (60 seconds for testnet which can be slow)
-        import time
-        for _ in range(60):
-            result = server.get_transaction(tx_hash)
-            if result.status == "SUCCESS":
-                logger.info(f"Settlement confirmed: {tx_hash}")
+        Returns:
+            Transaction hash
+        """
+        async with self._submit_lock:
+            # Reuse the client's pooled connection to the RPC server
+            server = self._client.server
+
+            admin_account = await self._get_admin_account()
+
+            try:
+                # Build transaction with contract invocation
+                builder = TransactionBuilder(
+                    source_account=admin_account,
+                    network_passphrase=self._client._network_passphrase,
+                    base_fee=100,
+                )
+                builder.append_operation(
+                    InvokeHostFunction(
+                        host_function=xdr.HostFunction(
+                            xdr.HostFunctionType.HOST_FUNCTION_TYPE_INVOKE_CONTRACT,
+                            invoke_contract=xdr.InvokeContractArgs(
+                                contract_address=self._contract_address,
+                                function_name=FUNCTION_SYMBOLS[function_name],
+                                args=parameters,
+                            ),
+                        ),
+                        auth=[],
+                    )
+                )
+                builder.set_timeout(30)
+                tx = builder.build()
+
+                # Simulate to get resource estimates
+                sim_response = await self._client.rpc(server.simulate_transaction, tx)
+
+                if sim_response.error:
+                    raise RuntimeError(f"Simulation failed: {sim_response.error}")
+
+                # Prepare transaction with simulation results
+                tx = await self._client.rpc(server.prepare_transaction, tx, sim_response)
+
+                # Sign with admin key
+                tx.sign(self._admin_keypair)
+
+                # Submit
+                response = await self._client.rpc(server.send_transaction, tx)
+
+                if response.status == SendTransactionStatus.ERROR:
+                    raise RuntimeError(f"Transaction failed: {response.error_result_xdr}")
+
+                tx_hash = response.hash
+
+                # Wait for confirmation without blocking the event loop
+                result = await self._client.wait_for_transaction(tx_hash)
+                if result.status == GetTransactionStatus.FAILED:
+                    raise RuntimeError(f"{description} failed: {result}")
+
+                logger.info(f"{description} confirmed: {tx_hash}")
                 return tx_hash
-            elif result.status == "FAILED":
-                raise RuntimeError(f"Settlement failed: {result}")
-            time.sleep(1)
-
-        raise TimeoutError(f"Settlement {tx_hash} did not confirm after 60s")
-
-    def _asset_to_scval(self, asset: str):
+            except Exception:
+                # Sequence may have been consumed locally but not on-chain
+                self._admin_account = None
+                raise
+
+    async def _get_admin_account(self) -> Account:
+        """Get the admin account, loading it from the network if not cached."""
+        if self._admin_account is None:
+            self._admin_account = await self._client.rpc(
+                self._client.server.load_account,
+                self._admin_keypair.public_key,
+            )
+        return self._admin_account
+
+    def _asset_to_scval(self, asset: str) -> xdr.SCVal:
         """Convert asset string to contract enum ScVal."""
-        # Asset enum in contract: A or B
-        if asset.lower() == "a":
-            return scval.to_enum("A", None)
-        elif asset.lower() == "b":
-            return scval.to_enum("B", None)
-        else:
-            raise ValueError(f"Unknown asset: {asset}")
+        try:
+            return ASSET_SCVALS[asset.lower()]
+        except KeyError:
+            raise ValueError(f"Unknown asset: {asset}") from None
@@ -2,11 +2,19 @@ import asyncio
 import logging
 from typing import Optional, Protocol
 
-from lumendark.models.message import Action, ActionType, MessageStatus
+from lumendark.models.message import (
+    Action,
+    MessageStatus,
+    SettlementAction,
+    WithdrawalAction,
+)
 from lumendark.queues.action_queue import ActionQueue
 
 logger = logging.getLogger(__name__)
 
+# Maximum actions taken from the queue per handler wakeup
+ACTION_BATCH_SIZE = 16
+
 
 class TransactionSubmitter(Protocol):
     """Protocol for submitting transactions to the blockchain."""
@@ -51,6 +59,8 @@ class ActionHandler:
         self._actions = action_queue
         self._tx_submitter = tx_submitter
         self._running = False
+        self._task: Optional[asyncio.Task] = None
+        self._idle = False
         self._nonce = initial_nonce
 
     @property
@@ -61,12 +71,19 @@ class ActionHandler:
     async def start(self) -> None:
         """Start the handler loop."""
         self._running = True
+        self._task = asyncio.current_task()
         logger.info("ActionHandler started")
 
+        # Block on the queue without a timeout; stop() interrupts the wait
+        # instead, so an idle handler never wakes the event loop.
         while self._running:
             try:
-                action = await self._actions.get(timeout=1.0)
-                if action is not None:
+                self._idle = True
+                actions = await self._actions.get_many(ACTION_BATCH_SIZE)
+                self._idle = False
+                # Submit one at a time: each transaction needs the contract
+                # nonce and admin sequence left by the one before it
+                for action in actions:
                     await self._process_action(action)
                     self._actions.task_done()
             except asyncio.CancelledError:
@@ -79,25 +96,28 @@ class ActionHandler:
     async def stop(self) -> None:
         """Stop the handler loop."""
         self._running = False
+        # Only interrupt a handler waiting for work, never one mid-processing
+        if self._idle and self._task is not None:
+            self._task.cancel()
 
     async def _process_action(self, action: Action) -> None:
         """Process a single action."""
         try:
             current_nonce = self._nonce
-            if action.type == ActionType.WITHDRAWAL:
+            if isinstance(action, WithdrawalAction):
                 tx_hash = await self._tx_submitter.submit_withdrawal(
                     nonce=current_nonce,
-                    user=action.payload["user"],
-                    asset=action.payload["asset"],
-                    amount=action.payload["amount"],
+                    user=action.user,
+                    asset=action.asset,
+                    amount=action.amount,
                 )
-            elif action.type == ActionType.SETTLEMENT:
+            elif isinstance(action, SettlementAction):
                 tx_hash = await self._tx_submitter.submit_settlement(
                     nonce=current_nonce,
-                    buyer=action.payload["buyer"],
-                    seller=action.payload["seller"],
-                    amount_a=action.payload["amount_a"],
-                    amount_b=action.payload["amount_b"],
+                    buyer=action.buyer,
+                    seller=action.seller,
+                    amount_a=action.amount_a,
+                    amount_b=action.amount_b,
                 )
             else:
                 logger.error(f"Unknown action type: {action.type}")
@@ -1,7 +1,8 @@
 import asyncio
 import logging
+from collections import defaultdict
 from decimal import Decimal, InvalidOperation
-from typing import Optional
+from typing import Any, Awaitable, Callable, Optional
 
 from lumendark.models.order import Order, OrderSide
 from lumendark.models.trade import Trade
@@ -10,6 +11,10 @@ from lumendark.models.message import (
     MessageType,
     MessageStatus,
     Action,
+    DepositMessage,
+    OrderMessage,
+    CancelMessage,
+    WithdrawMessage,
 )
 from lumendark.storage.user_store import UserStore
 from lumendark.storage.order_book import OrderBook
@@ -20,6 +25,14 @@ from lumendark.matching.engine import MatchingEngine
 
 logger = logging.getLogger(__name__)
 
+# Maximum messages taken from the queue per handler wakeup
+MESSAGE_BATCH_SIZE = 64
+
+# Module-level references: Enum class attribute lookup is slow before 3.12
+_BUY = OrderSide.BUY
+_PROCESSING = MessageStatus.PROCESSING
+_SIDES = {side.value: side for side in OrderSide}
+
 
 class MessageHandler:
     """
@@ -44,16 +57,31 @@ class MessageHandler:
         self._messages = message_store
         self._engine = MatchingEngine(order_book)
         self._running = False
+        self._task: Optional[asyncio.Task] = None
+        self._idle = False
+        # Message type -> processing step. Steps that queue actions are
+        # coroutines; the rest run synchronously.
+        self._dispatch: dict[MessageType, Callable[[Any], Optional[Awaitable[None]]]] = {
+            MessageType.DEPOSIT: self._process_deposit,
+            MessageType.ORDER: self._process_order,
+            MessageType.CANCEL: self._process_cancel,
+            MessageType.WITHDRAW: self._process_withdraw,
+        }
 
     async def start(self) -> None:
         """Start the handler loop."""
         self._running = True
+        self._task = asyncio.current_task()
         logger.info("MessageHandler started")
 
+        # Block on the queue without a timeout; stop() interrupts the wait
+        # instead, so an idle handler never wakes the event loop.
         while self._running:
             try:
-                message = await self._messages_in.get(timeout=1.0)
-                if message is not None:
+                self._idle = True
+                messages = await self._messages_in.get_many(MESSAGE_BATCH_SIZE)
+                self._idle = False
+                for message in messages:
                     await self._process_message(message)
                     self._messages_in.task_done()
             except asyncio.CancelledError:
@@ -66,34 +94,35 @@ class MessageHandler:
     async def stop(self) -> None:
         """Stop the handler loop."""
         self._running = False
+        # Only interrupt a handler waiting for work, never one mid-processing
+        if self._idle and self._task is not None:
+            self._task.cancel()
 
     async def _process_message(self, message: Message) -> None:
         """Process a single message."""
-        message.status = MessageStatus.PROCESSING
-        self._messages.update(message)
+        # The store holds this same object, so status changes are visible to
+        # readers without a write; one update after processing suffices
+        message.status = _PROCESSING
 
         try:
-            if message.type == MessageType.DEPOSIT:
-                await self._process_deposit(message)
-            elif message.type == MessageType.ORDER:
-                await self._process_order(message)
-            elif message.type == MessageType.CANCEL:
-                await self._process_cancel(message)
-            elif message.type == MessageType.WITHDRAW:
-                await self._process_withdraw(message)
-            else:
+            process = self._dispatch.get(message.type)
+            if process is None:
                 message.reject(f"Unknown message type: {message.type}")
+            else:
+                result = process(message)
+                if result is not None:
+                    await result
         except Exception as e:
             logger.exception(f"Error processing message {message.id}: {e}")
             message.reject(str(e))
 
         self._messages.update(message)
 
-    async def _process_deposit(self, message: Message) -> None:
+    def _process_deposit(self, message: DepositMessage) -> None:
         """Process a deposit message from blockchain event."""
-        asset = message.payload["asset"]
+        asset = message.asset
         try:
-            amount = Decimal(str(message.payload["amount"]))
+            amount = Decimal(message.amount)
         except (InvalidOperation, ValueError) as e:
             message.reject(f"Invalid amount: {e}")
             return
@@ -105,17 +134,24 @@ class MessageHandler:
         self._users.deposit(message.user_address, asset, amount)
         message.accept()
 
-        logger.info(f"Deposit processed: {message.user_address} +{amount} {asset}")
+        logger.info("Deposit processed: %s +%s %s", message.user_address, amount, asset)
 
-    async def _process_order(self, message: Message) -> None:
+    async def _process_order(self, message: OrderMessage) -> None:
         """Process a new order message."""
-        # Parse order parameters
-        try:
-            side = OrderSide(message.payload["side"])
-            price = Decimal(str(message.payload["price"]))
-            quantity = Decimal(str(message.payload["quantity"]))
-        except (ValueError, InvalidOperation) as e:
-            message.reject(f"Invalid order parameters: {e}")
+        # Price and quantity were parsed when the message was created
+        price = message.price_value
+        quantity = message.quantity_value
+        if price is None or quantity is None:
+            message.reject(
+                f"Invalid order parameters: price={message.price!r}, "
+                f"quantity={message.quantity!r}"
+            )
+            return
+        side = _SIDES.get(message.side)
+        if side is None:
+            message.reject(
+                f"Invalid order parameters: {message.side!r} is not a valid OrderSide"
+            )
             return
 
         if price <= 0 or quantity <= 0:
@@ -129,22 +165,19 @@ class MessageHandler:
             return
 
         # Calculate required balance for liability
-        if side == OrderSide.BUY:
+        if side is _BUY:
             required = price * quantity
             asset = "b"
         else:
             required = quantity
             asset = "a"
 
-        # Check and allocate balance
-        if not self._users.can_allocate(message.user_address, asset, required):
+        # Allocate funds (move from available to liabilities) if sufficient
+        if not self._users.try_allocate(message.user_address, asset, required):
             available = self._users.get_available(message.user_address, asset)
             message.reject(f"Insufficient balance: have {available}, need {required}")
             return
 
-        # Allocate funds (move from available to liabilities)
-        self._users.allocate(message.user_address, asset, required)
-
         # Create order
         order = Order.create(
             user_address=message.user_address,
@@ -156,9 +189,15 @@ class MessageHandler:
         # Match against book
         result = self._engine.match(order)
 
-        # Process trades
-        for trade in result.trades:
-            await self._process_trade(trade, order.side)
+        # Net the trades' balance changes per user and asset, apply them in
+        # one pass, then queue the settlements together
+        consumed: defaultdict[tuple[str, str], Decimal] = defaultdict(Decimal)
+        credited: defaultdict[tuple[str, str], Decimal] = defaultdict(Decimal)
+        settlements = [
+            self._process_trade(trade, consumed, credited) for trade in result.trades
+        ]
+        self._users.apply_fills(consumed, credited)
+        await self._actions.put_many(settlements)
 
         # Add remaining to book if not fully filled
         if result.remaining_order is not None:
@@ -169,70 +208,71 @@ class MessageHandler:
         message.accept()
 
         logger.info(
-            f"Order processed: {order.id}, {len(result.trades)} trades, "
-            f"remaining={result.remaining_order.remaining_quantity if result.remaining_order else 0}"
+            "Order processed: %s, %d trades, remaining=%s",
+            order.id,
+            len(result.trades),
+            result.remaining_order.remaining_quantity if result.remaining_order else 0,
         )
 
-    async def _process_trade(self, trade: Trade, taker_side: OrderSide) -> None:
-        """Process a trade and queue settlement action."""
-        # Update liabilities for both parties
-        # The taker's liability was already allocated when the order was placed
-        # The maker's liability needs to be consumed
-
-        if taker_side == OrderSide.BUY:
-            # Taker bought asset A, paid asset B
-            # Taker: consume B liability (price * quantity)
-            self._users.consume_liability(trade.buyer_address, "b", trade.amount_b)
-            # Maker (seller): consume A liability (quantity)
-            self._users.consume_liability(trade.seller_address, "a", trade.amount_a)
-            # Credit: taker gets A, maker gets B
-            self._users.credit(trade.buyer_address, "a", trade.amount_a)
-            self._users.credit(trade.seller_address, "b", trade.amount_b)
-        else:
-            # Taker sold asset A, received asset B
-            # Taker: consume A liability (quantity)
-            self._users.consume_liability(trade.seller_address, "a", trade.amount_a)
-            # Maker (buyer): consume B liability (price * quantity)
-            self._users.consume_liability(trade.buyer_address, "b", trade.amount_b)
-            # Credit: taker gets B, maker gets A
-            self._users.credit(trade.seller_address, "b", trade.amount_b)
-            self._users.credit(trade.buyer_address, "a", trade.amount_a)
-
-        # Queue trade for on-chain settlement
+    def _process_trade(
+        self,
+        trade: Trade,
+        consumed: defaultdict[tuple[str, str], Decimal],
+        credited: defaultdict[tuple[str, str], Decimal],
+    ) -> Action:
+        """
+        Record a trade's balance changes and build its settlement action.
+
+        Whichever side was the taker, the buyer's B liability and the
+        seller's A liability are consumed (the taker's was allocated when
+        its order was placed), the buyer is credited A and the seller B.
+
+        Args:
+            trade: The executed trade
+            consumed: (address, asset) -> liabilities to consume, updated
+            credited: (address, asset) -> amount to credit, updated
+        """
+        amount_a = trade.amount_a
+        amount_b = trade.amount_b
+        consumed[(trade.buyer_address, "b")] += amount_b
+        consumed[(trade.seller_address, "a")] += amount_a
+        credited[(trade.buyer_address, "a")] += amount_a
+        credited[(trade.seller_address, "b")] += amount_b
+
+        # Settle the trade on-chain
         action = Action.create_settlement(
             trade_id=trade.id,
             buyer_address=trade.buyer_address,
             seller_address=trade.seller_address,
-            amount_a=str(trade.amount_a),
-            amount_b=str(trade.amount_b),
+            amount_a=str(amount_a),
+            amount_b=str(amount_b),
         )
-        await self._actions.put(action)
+        logger.debug("Settlement action created: %s", trade.id)
+        return action
 
-        logger.debug(f"Settlement action queued: {trade.id}")
-
-    async def _process_cancel(self, message: Message) -> None:
+    def _process_cancel(self, message: CancelMessage) -> None:
         """Process an order cancellation."""
-        order_id = message.payload.get("order_id")
+        order_id = message.target_order_id
         if not order_id:
             message.reject("Missing order_id")
             return
 
-        # Find and remove from book
-        order = self._order_book.remove(order_id)
+        order = self._order_book.get(order_id)
         if order is None:
             message.reject(f"Order not found: {order_id}")
             return
 
-        # Verify ownership
+        # Verify ownership before removing, so a rejected cancel
+        # leaves the order's queue position untouched
         if order.user_address != message.user_address:
-            # Put it back
-            self._order_book.add(order)
             message.reject("Cannot cancel another user's order")
             return
 
+        self._order_book.remove(order_id)
+
         # Release liabilities back to available
         remaining = order.remaining_quantity
-        if order.side == OrderSide.BUY:
+        if order.side is _BUY:
             amount = order.price * remaining
             asset = "b"
         else:
@@ -243,18 +283,18 @@ class MessageHandler:
         order.cancel()
 
         message.accept()
-        logger.info(f"Order cancelled: {order_id}")
+        logger.info("Order cancelled: %s", order_id)
 
-    async def _process_withdraw(self, message: Message) -> None:
+    async def _process_withdraw(self, message: WithdrawMessage) -> None:
         """Process a withdrawal request."""
-        asset = message.payload.get("asset")
+        asset = message.asset
         if asset not in ("a", "b"):
             message.reject(f"Invalid asset: {asset}")
             return
 
         try:
-            amount = Decimal(str(message.payload["amount"]))
-        except (InvalidOperation, ValueError, KeyError) as e:
+            amount = Decimal(message.amount)
+        except (InvalidOperation, ValueError) as e:
             message.reject(f"Invalid amount: {e}")
             return
 
@@ -262,15 +302,12 @@ class MessageHandler:
             message.reject("Amount must be positive")
             return
 
-        # Check if user can withdraw
-        if not self._users.can_withdraw(message.user_address, asset, amount):
+        # Decrease available balance if sufficient
+        if not self._users.try_withdraw(message.user_address, asset, amount):
             available = self._users.get_available(message.user_address, asset)
             message.reject(f"Insufficient available balance: have {available}, need {amount}")
             return
 
-        # Decrease available balance
-        self._users.withdraw(message.user_address, asset, amount)
-
         # Queue withdrawal action for on-chain execution
         action = Action.create_withdrawal(
             user_address=message.user_address,
@@ -280,4 +317,6 @@ class MessageHandler:
         await self._actions.put(action)
 
         message.accept()
-        logger.info(f"Withdrawal action queued: {message.user_address} {amount} {asset}")
+        logger.info(
+            "Withdrawal action queued: %s %s %s", message.user_address, amount, asset
+        )
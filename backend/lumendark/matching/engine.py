@@ -1,10 +1,12 @@
-from decimal import Decimal
 from typing import NamedTuple, Optional
 
 from lumendark.models.order import Order, OrderSide
 from lumendark.models.trade import Trade
 from lumendark.storage.order_book import OrderBook
 
+# Module-level reference: Enum class attribute lookup is slow before 3.12
+_BUY = OrderSide.BUY
+
 
 class MatchResult(NamedTuple):
     """Result of matching an incoming order."""
@@ -32,51 +34,63 @@ class MatchingEngine:
         The incoming order is modified in place to reflect fills.
         Orders are removed from the book as they are fully filled.
         """
-        if incoming.side == OrderSide.BUY:
+        if incoming.side is _BUY:
             trades = self._match_buy(incoming)
         else:
             trades = self._match_sell(incoming)
 
         # Return remaining order if not fully filled
-        remaining = incoming if incoming.remaining_quantity > Decimal("0") else None
+        remaining = incoming if incoming.remaining_quantity > 0 else None
         return MatchResult(trades=trades, remaining_order=remaining)
 
     def _match_buy(self, incoming: Order) -> list[Trade]:
         """Match a buy order against asks."""
         trades: list[Trade] = []
 
-        # Get asks that could match (price <= incoming price)
-        matching_asks = list(self._book.iter_matching_asks(incoming.price))
+        # Walk asks that could match (price <= incoming price) in place,
+        # skipping the user's own orders and stopping once filled
+        matching_asks = self._book.iter_matching_asks(
+            incoming.price, exclude_user=incoming.user_address
+        )
 
-        for resting in matching_asks:
-            if incoming.remaining_quantity <= Decimal("0"):
-                break
+        # Track the incoming order's remainder locally so each fill costs one
+        # Decimal subtraction rather than recomputing it through the property
+        remaining = incoming.remaining_quantity
 
-            # Skip self-matching
-            if resting.user_address == incoming.user_address:
-                continue
+        # Bind per-fill lookups once for the loop
+        buyer_address = incoming.user_address
+        buy_order_id = incoming.id
+        append_trade = trades.append
+        remove_resting = self._book.remove
 
+        for resting in matching_asks:
             # Determine trade quantity
-            trade_qty = min(incoming.remaining_quantity, resting.remaining_quantity)
+            resting_remaining = resting.remaining_quantity
+            trade_qty = remaining if remaining < resting_remaining else resting_remaining
+            remaining -= trade_qty
 
             # Create trade at resting order's price
             trade = Trade.create(
-                buyer_address=incoming.user_address,
+                buyer_address=buyer_address,
                 seller_address=resting.user_address,
-                buy_order_id=incoming.id,
+                buy_order_id=buy_order_id,
                 sell_order_id=resting.id,
                 price=resting.price,  # Execute at resting price
                 quantity=trade_qty,
             )
-            trades.append(trade)
+            append_trade(trade)
 
             # Update order quantities
             incoming.fill(trade_qty)
             resting.fill(trade_qty)
 
             # Remove fully filled resting orders from book
-            if resting.remaining_quantity == Decimal("0"):
-                self._book.remove(resting.id)
+            if trade_qty == resting_remaining:
+                remove_resting(resting.id)
+
+            # Stop before advancing the iterator to another resting order
+            if remaining <= 0:
+                break
 
         return trades
 
@@ -84,37 +98,49 @@ class MatchingEngine:
         """Match a sell order against bids."""
         trades: list[Trade] = []
 
-        # Get bids that could match (price >= incoming price)
-        matching_bids = list(self._book.iter_matching_bids(incoming.price))
+        # Walk bids that could match (price >= incoming price) in place,
+        # skipping the user's own orders and stopping once filled
+        matching_bids = self._book.iter_matching_bids(
+            incoming.price, exclude_user=incoming.user_address
+        )
 
-        for resting in matching_bids:
-            if incoming.remaining_quantity <= Decimal("0"):
-                break
+        # Track the incoming order's remainder locally so each fill costs one
+        # Decimal subtraction rather than recomputing it through the property
+        remaining = incoming.remaining_quantity
 
-            # Skip self-matching
-            if resting.user_address == incoming.user_address:
-                continue
+        # Bind per-fill lookups once for the loop
+        seller_address = incoming.user_address
+        sell_order_id = incoming.id
+        append_trade = trades.append
+        remove_resting = self._book.remove
 
+        for resting in matching_bids:
             # Determine trade quantity
-            trade_qty = min(incoming.remaining_quantity, resting.remaining_quantity)
+            resting_remaining = resting.remaining_quantity
+            trade_qty = remaining if remaining < resting_remaining else resting_remaining
+            remaining -= trade_qty
 
             # Create trade at resting order's price
             trade = Trade.create(
                 buyer_address=resting.user_address,
-                seller_address=incoming.user_address,
+                seller_address=seller_address,
                 buy_order_id=resting.id,
-                sell_order_id=incoming.id,
+                sell_order_id=sell_order_id,
                 price=resting.price,  # Execute at resting price
                 quantity=trade_qty,
             )
-            trades.append(trade)
+            append_trade(trade)
 
             # Update order quantities
             incoming.fill(trade_qty)
             resting.fill(trade_qty)
 
             # Remove fully filled resting orders from book
-            if resting.remaining_quantity == Decimal("0"):
-                self._book.remove(resting.id)
+            if trade_qty == resting_remaining:
+                remove_resting(resting.id)
+
+            # Stop before advancing the iterator to another resting order
+            if remaining <= 0:
+                break
 
         return trades
@@ -3,7 +3,13 @@ from lumendark.models.user import User, UserBalance
 from lumendark.models.trade import Trade
 from lumendark.models.message import (
     Message,
+    DepositMessage,
+    OrderMessage,
+    CancelMessage,
+    WithdrawMessage,
     Action,
+    WithdrawalAction,
+    SettlementAction,
     MessageType,
     MessageStatus,
     ActionType,
@@ -17,7 +23,13 @@ __all__ = [
     "UserBalance",
     "Trade",
     "Message",
+    "DepositMessage",
+    "OrderMessage",
+    "CancelMessage",
+    "WithdrawMessage",
     "Action",
+    "WithdrawalAction",
+    "SettlementAction",
     "MessageType",
     "MessageStatus",
     "ActionType",
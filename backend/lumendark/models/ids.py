@@ -0,0 +1,15 @@
+"""Identifier generation for models."""
+
+import itertools
+
+_sequence = itertools.count(1)
+
+
+def sequential_id() -> str:
+    """
+    Process-unique ID for internal objects (trades, actions).
+
+    IDs that clients see or look up (messages, orders) stay random UUIDs,
+    since the status endpoint treats knowing a message ID as access to it.
+    """
+    return format(next(_sequence), "x")
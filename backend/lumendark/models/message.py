@@ -1,9 +1,24 @@
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
 from enum import Enum
 from typing import Any, Optional
+import sys
+import time
 import uuid
 
+from lumendark.models.ids import sequential_id
+from lumendark.models.timestamps import ns_to_datetime
+
+
+def _parse_decimal(value: str) -> Optional[Decimal]:
+    """Parse a decimal string, or return None if it is not a finite number."""
+    try:
+        parsed = Decimal(value)
+    except (InvalidOperation, TypeError, ValueError):
+        return None
+    return parsed if parsed.is_finite() else None
+
 
 class MessageType(Enum):
     """Types of messages from users/blockchain."""
@@ -23,23 +38,30 @@ class MessageStatus(Enum):
     REJECTED = "rejected"  # Failed validation/processing
 
 
-@dataclass
+# Module-level references: Enum class attribute lookup is slow before 3.12
+_ACCEPTED = MessageStatus.ACCEPTED
+_REJECTED = MessageStatus.REJECTED
+
+
+@dataclass(slots=True)
 class Message:
     """
     Message from users or blockchain events.
 
     All user requests (orders, cancels, withdrawals) and blockchain events
     (deposits) are represented as messages and processed by the MessageHandler.
+    Each message type is a subclass carrying its parameters as typed fields;
+    `type` tells them apart without isinstance checks.
     """
 
     id: str
     type: MessageType
     user_address: str
-    payload: dict[str, Any]
     status: MessageStatus = MessageStatus.PENDING
     rejection_reason: Optional[str] = None
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
-    processed_at: Optional[datetime] = None
+    # Wall-clock nanoseconds; datetimes are only built when read
+    created_at_ns: int = field(default_factory=time.time_ns)
+    processed_at_ns: Optional[int] = None
 
     # Set after processing for ORDER messages
     order_id: Optional[str] = None
@@ -52,18 +74,16 @@ class Message:
         amount: str,
         ledger: int,
         tx_hash: str,
-    ) -> "Message":
+    ) -> "DepositMessage":
         """Create a deposit message from a blockchain event."""
-        return Message(
+        return DepositMessage(
             id=str(uuid.uuid4()),
             type=MessageType.DEPOSIT,
-            user_address=user_address,
-            payload={
-                "asset": asset,
-                "amount": amount,
-                "ledger": ledger,
-                "tx_hash": tx_hash,
-            },
+            user_address=sys.intern(user_address),
+            asset=asset,
+            amount=amount,
+            ledger=ledger,
+            tx_hash=tx_hash,
         )
 
     @staticmethod
@@ -72,32 +92,30 @@ class Message:
         side: str,
         price: str,
         quantity: str,
-    ) -> "Message":
+    ) -> "OrderMessage":
         """Create an order message."""
-        return Message(
+        return OrderMessage(
             id=str(uuid.uuid4()),
             type=MessageType.ORDER,
-            user_address=user_address,
-            payload={
-                "side": side,
-                "price": price,
-                "quantity": quantity,
-            },
+            user_address=sys.intern(user_address),
+            side=side,
+            price=price,
+            quantity=quantity,
+            price_value=_parse_decimal(price),
+            quantity_value=_parse_decimal(quantity),
         )
 
     @staticmethod
     def create_cancel(
         user_address: str,
         order_id: str,
-    ) -> "Message":
+    ) -> "CancelMessage":
         """Create a cancel message."""
-        return Message(
+        return CancelMessage(
             id=str(uuid.uuid4()),
             type=MessageType.CANCEL,
-            user_address=user_address,
-            payload={
-                "order_id": order_id,
-            },
+            user_address=sys.intern(user_address),
+            target_order_id=order_id,
         )
 
     @staticmethod
@@ -105,28 +123,103 @@ class Message:
         user_address: str,
         asset: str,
         amount: str,
-    ) -> "Message":
+    ) -> "WithdrawMessage":
         """Create a withdrawal message."""
-        return Message(
+        return WithdrawMessage(
             id=str(uuid.uuid4()),
             type=MessageType.WITHDRAW,
-            user_address=user_address,
-            payload={
-                "asset": asset,
-                "amount": amount,
-            },
+            user_address=sys.intern(user_address),
+            asset=asset,
+            amount=amount,
         )
 
+    @property
+    def payload(self) -> dict[str, Any]:
+        """Type-specific parameters as a dict, for logging and inspection."""
+        return {}
+
+    @property
+    def created_at(self) -> datetime:
+        """When the message was created."""
+        return ns_to_datetime(self.created_at_ns)
+
+    @property
+    def processed_at(self) -> Optional[datetime]:
+        """When the message was accepted or rejected, if it has been."""
+        if self.processed_at_ns is None:
+            return None
+        return ns_to_datetime(self.processed_at_ns)
+
     def accept(self) -> None:
         """Mark message as accepted."""
-        self.status = MessageStatus.ACCEPTED
-        self.processed_at = datetime.now(timezone.utc)
+        self.status = _ACCEPTED
+        self.processed_at_ns = time.time_ns()
 
     def reject(self, reason: str) -> None:
         """Mark message as rejected with a reason."""
-        self.status = MessageStatus.REJECTED
+        self.status = _REJECTED
         self.rejection_reason = reason
-        self.processed_at = datetime.now(timezone.utc)
+        self.processed_at_ns = time.time_ns()
+
+
+@dataclass(slots=True, kw_only=True)
+class DepositMessage(Message):
+    """Deposit seen on chain by the event listener."""
+
+    asset: str
+    amount: str
+    ledger: int
+    tx_hash: str
+
+    @property
+    def payload(self) -> dict[str, Any]:
+        return {
+            "asset": self.asset,
+            "amount": self.amount,
+            "ledger": self.ledger,
+            "tx_hash": self.tx_hash,
+        }
+
+
+@dataclass(slots=True, kw_only=True)
+class OrderMessage(Message):
+    """New limit order."""
+
+    side: str
+    price: str
+    quantity: str
+    # Parsed at creation, off the handler's serial path; None if invalid
+    price_value: Optional[Decimal] = None
+    quantity_value: Optional[Decimal] = None
+
+    @property
+    def payload(self) -> dict[str, Any]:
+        return {"side": self.side, "price": self.price, "quantity": self.quantity}
+
+
+@dataclass(slots=True, kw_only=True)
+class CancelMessage(Message):
+    """Cancellation of a resting order."""
+
+    # Distinct from Message.order_id, which records the order an ORDER
+    # message left resting in the book
+    target_order_id: str
+
+    @property
+    def payload(self) -> dict[str, Any]:
+        return {"order_id": self.target_order_id}
+
+
+@dataclass(slots=True, kw_only=True)
+class WithdrawMessage(Message):
+    """Withdrawal request."""
+
+    asset: str
+    amount: str
+
+    @property
+    def payload(self) -> dict[str, Any]:
+        return {"asset": self.asset, "amount": self.amount}
 
 
 class ActionType(Enum):
@@ -136,37 +229,45 @@ class ActionType(Enum):
     SETTLEMENT = "settlement"
 
 
-@dataclass
+@dataclass(slots=True)
 class Action:
     """
     Action to be submitted to the blockchain.
 
     Trade settlements and withdrawals are queued as actions and
-    processed by the ActionHandler.
+    processed by the ActionHandler. Each action type is a subclass
+    carrying its contract call arguments as typed fields.
     """
 
     id: str
     type: ActionType
-    payload: dict[str, Any]
     status: MessageStatus = MessageStatus.PENDING
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at_ns: int = field(default_factory=time.time_ns)
     tx_hash: Optional[str] = None
 
+    @property
+    def created_at(self) -> datetime:
+        """When the action was created."""
+        return ns_to_datetime(self.created_at_ns)
+
+    @property
+    def payload(self) -> dict[str, Any]:
+        """Type-specific arguments as a dict, for logging and inspection."""
+        return {}
+
     @staticmethod
     def create_withdrawal(
         user_address: str,
         asset: str,
         amount: str,
-    ) -> "Action":
+    ) -> "WithdrawalAction":
         """Create a withdrawal action."""
-        return Action(
-            id=str(uuid.uuid4()),
+        return WithdrawalAction(
+            id=sequential_id(),
             type=ActionType.WITHDRAWAL,
-            payload={
-                "user": user_address,
-                "asset": asset,
-                "amount": amount,
-            },
+            user=user_address,
+            asset=asset,
+            amount=amount,
         )
 
     @staticmethod
@@ -176,16 +277,48 @@ class Action:
         seller_address: str,
         amount_a: str,
         amount_b: str,
-    ) -> "Action":
+    ) -> "SettlementAction":
         """Create a trade settlement action."""
-        return Action(
-            id=str(uuid.uuid4()),
+        return SettlementAction(
+            id=sequential_id(),
             type=ActionType.SETTLEMENT,
-            payload={
-                "trade_id": trade_id,
-                "buyer": buyer_address,
-                "seller": seller_address,
-                "amount_a": amount_a,
-                "amount_b": amount_b,
-            },
+            trade_id=trade_id,
+            buyer=buyer_address,
+            seller=seller_address,
+            amount_a=amount_a,
+            amount_b=amount_b,
         )
+
+
+@dataclass(slots=True, kw_only=True)
+class WithdrawalAction(Action):
+    """Withdrawal of a user's funds from the contract."""
+
+    user: str
+    asset: str
+    amount: str
+
+    @property
+    def payload(self) -> dict[str, Any]:
+        return {"user": self.user, "asset": self.asset, "amount": self.amount}
+
+
+@dataclass(slots=True, kw_only=True)
+class SettlementAction(Action):
+    """On-chain settlement of a matched trade."""
+
+    trade_id: str
+    buyer: str
+    seller: str
+    amount_a: str
+    amount_b: str
+
+    @property
+    def payload(self) -> dict[str, Any]:
+        return {
+            "trade_id": self.trade_id,
+            "buyer": self.buyer,
+            "seller": self.seller,
+            "amount_a": self.amount_a,
+            "amount_b": self.amount_b,
+        }
@@ -0,0 +1,8 @@
+"""Timestamp helpers for models."""
+
+from datetime import datetime, timezone
+
+
+def ns_to_datetime(timestamp_ns: int) -> datetime:
+    """Convert a time.time_ns() timestamp to a UTC datetime."""
+    return datetime.fromtimestamp(timestamp_ns / 1e9, timezone.utc)
@@ -1,10 +1,13 @@
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime
 from decimal import Decimal
-import uuid
+import time
 
+from lumendark.models.ids import sequential_id
+from lumendark.models.timestamps import ns_to_datetime
 
-@dataclass
+
+@dataclass(slots=True)
 class Trade:
     """
     Represents an executed trade between two orders.
@@ -21,7 +24,8 @@ class Trade:
     sell_order_id: str  # The sell order involved
     price: Decimal  # Execution price (in asset B per unit of asset A)
     quantity: Decimal  # Quantity of asset A traded
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    # Wall-clock nanoseconds; the datetime is only built when read
+    created_at_ns: int = field(default_factory=time.time_ns)
 
     @staticmethod
     def create(
@@ -34,7 +38,7 @@ class Trade:
     ) -> "Trade":
         """Factory method to create a new trade with generated ID."""
         return Trade(
-            id=str(uuid.uuid4()),
+            id=sequential_id(),
             buyer_address=buyer_address,
             seller_address=seller_address,
             buy_order_id=buy_order_id,
@@ -43,6 +47,11 @@ class Trade:
             quantity=quantity,
         )
 
+    @property
+    def created_at(self) -> datetime:
+        """When the trade was executed."""
+        return ns_to_datetime(self.created_at_ns)
+
     @property
     def value(self) -> Decimal:
         """Value of the trade in asset B."""
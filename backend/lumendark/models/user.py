@@ -2,7 +2,7 @@ from dataclasses import dataclass, field
 from decimal import Decimal
 
 
-@dataclass
+@dataclass(slots=True)
 class UserBalance:
     """
     Balance tracking for a single asset.
@@ -26,11 +26,19 @@ class UserBalance:
 
     def allocate(self, amount: Decimal) -> None:
         """Move funds from available to liabilities (for new orders)."""
-        if not self.can_allocate(amount):
+        if self.available < amount:
             raise ValueError(f"Insufficient available balance: have {self.available}, need {amount}")
         self.available -= amount
         self.liabilities += amount
 
+    def try_allocate(self, amount: Decimal) -> bool:
+        """Allocate if enough is available. Returns False, changing nothing, if not."""
+        if self.available < amount:
+            return False
+        self.available -= amount
+        self.liabilities += amount
+        return True
+
     def release(self, amount: Decimal) -> None:
         """Move funds from liabilities back to available (for cancellations)."""
         if self.liabilities < amount:
@@ -54,12 +62,19 @@ class UserBalance:
 
     def withdraw(self, amount: Decimal) -> None:
         """Remove funds from available balance."""
-        if not self.can_withdraw(amount):
+        if self.available < amount:
             raise ValueError(f"Insufficient available balance: have {self.available}, need {amount}")
         self.available -= amount
 
+    def try_withdraw(self, amount: Decimal) -> bool:
+        """Withdraw if enough is available. Returns False, changing nothing, if not."""
+        if self.available < amount:
+            return False
+        self.available -= amount
+        return True
+
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """
     User account with balances for both assets.
@@ -1,7 +1,9 @@
+from lumendark.queues.base import AsyncQueue
 from lumendark.queues.message_queue import MessageQueue
 from lumendark.queues.action_queue import ActionQueue
 
 __all__ = [
+    "AsyncQueue",
     "MessageQueue",
     "ActionQueue",
 ]
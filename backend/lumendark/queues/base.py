@@ -0,0 +1,107 @@
+import asyncio
+from typing import Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class AsyncQueue(Generic[T]):
+    """
+    Async FIFO queue shared by the message and action pipelines.
+
+    Wraps asyncio.Queue with timeouts that return instead of raising and
+    with batch draining for consumers.
+    """
+
+    def __init__(self, maxsize: int = 0) -> None:
+        """
+        Initialize the queue.
+
+        Args:
+            maxsize: Maximum number of queued items. 0 for unbounded.
+        """
+        self._queue: asyncio.Queue[T] = asyncio.Queue(maxsize=maxsize)
+
+    async def put(self, item: T, timeout: Optional[float] = None) -> bool:
+        """
+        Add an item to the queue, waiting for space if it is full.
+
+        Args:
+            item: The item to add.
+            timeout: Maximum time to wait in seconds. None for no timeout.
+
+        Returns:
+            True if the item was queued, False if timeout expired.
+        """
+        # Fast path: with space available, skip the task wait_for creates
+        try:
+            self._queue.put_nowait(item)
+            return True
+        except asyncio.QueueFull:
+            pass
+
+        try:
+            if timeout is None:
+                await self._queue.put(item)
+            else:
+                await asyncio.wait_for(self._queue.put(item), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[T]:
+        """
+        Get an item from the queue.
+
+        Args:
+            timeout: Maximum time to wait in seconds. None for no timeout.
+
+        Returns:
+            The item, or None if timeout expired.
+        """
+        # Fast path: with an item ready, skip the task wait_for creates
+        try:
+            return self._queue.get_nowait()
+        except asyncio.QueueEmpty:
+            pass
+
+        try:
+            if timeout is None:
+                return await self._queue.get()
+            else:
+                return await asyncio.wait_for(self._queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def get_many(self, max_items: int) -> list[T]:
+        """
+        Wait for an item, then take whatever else is already queued.
+
+        Args:
+            max_items: Maximum number of items to return
+
+        Returns:
+            Between 1 and max_items items, in queue order.
+        """
+        items = [await self._queue.get()]
+        while len(items) < max_items and not self._queue.empty():
+            items.append(self._queue.get_nowait())
+        return items
+
+    def task_done(self) -> None:
+        """Mark the current task as done."""
+        self._queue.task_done()
+
+    @property
+    def qsize(self) -> int:
+        """Approximate queue size."""
+        return self._queue.qsize()
+
+    @property
+    def maxsize(self) -> int:
+        """Maximum queue size (0 if unbounded)."""
+        return self._queue.maxsize
+
+    @property
+    def empty(self) -> bool:
+        """Whether the queue is empty."""
+        return self._queue.empty()
@@ -1,31 +1,64 @@
-from threading import RLock
 from typing import Optional
 
 from lumendark.models.message import Message
+from lumendark.queues.message_queue import MessageQueue
 
 
 class MessageStore:
     """
-    Thread-safe storage for message status tracking.
+    Storage for message status tracking.
 
-    Allows querying the status of submitted messages by ID.
+    Allows querying the status of submitted messages by ID. Not
+    thread-safe: it is only used from the event loop.
     """
 
     def __init__(self) -> None:
         self._messages: dict[str, Message] = {}
-        self._lock = RLock()
 
     def add(self, message: Message) -> None:
         """Add a message to the store."""
-        with self._lock:
-            self._messages[message.id] = message
+        self._messages[message.id] = message
 
     def get(self, message_id: str) -> Optional[Message]:
         """Get a message by ID."""
-        with self._lock:
-            return self._messages.get(message_id)
+        return self._messages.get(message_id)
+
+    def remove(self, message_id: str) -> Optional[Message]:
+        """Remove a message by ID. Returns the message or None if not found."""
+        return self._messages.pop(message_id, None)
 
     def update(self, message: Message) -> None:
         """Update a message in the store."""
-        with self._lock:
-            self._messages[message.id] = message
+        self._messages[message.id] = message
+
+    async def submit(
+        self,
+        message: Message,
+        queue: MessageQueue,
+        timeout: Optional[float] = None,
+    ) -> bool:
+        """
+        Store a message and queue it for processing.
+
+        The message is stored before it is queued so its status can be
+        queried as soon as the handler may pick it up. If the queue stays
+        full, it is removed again: the caller never learns its ID.
+
+        Args:
+            message: The message to submit.
+            queue: Queue the message is published to.
+            timeout: Maximum time to wait for queue space. None for no timeout.
+
+        Returns:
+            True if the message was queued, False if timeout expired.
+        """
+        self.add(message)
+        if await queue.put(message, timeout=timeout):
+            return True
+        self.remove(message.id)
+        return False
+
+    @property
+    def message_count(self) -> int:
+        """Number of messages in the store."""
+        return len(self._messages)
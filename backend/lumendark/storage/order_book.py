@@ -1,134 +1,205 @@
+from collections import deque
 from decimal import Decimal
-from threading import RLock
-from typing import Iterator, Optional
+from itertools import chain, islice
+from operator import neg
+from typing import Callable, Iterator, Optional
 
-from sortedcontainers import SortedList
+from sortedcontainers import SortedDict
 
 from lumendark.models.order import Order, OrderSide
 
+# Module-level reference: Enum class attribute lookup is slow before 3.12
+_BUY = OrderSide.BUY
+
+
+def _iter_levels(
+    levels: SortedDict,
+    crosses: Callable[[Decimal], bool],
+    excluded: dict[str, Order],
+) -> Iterator[Order]:
+    """
+    Yield orders level by level, FIFO within a level, while crosses(price).
+
+    Walks by index so the caller may remove the yielded order (and with it
+    an emptied level) before advancing.
+    """
+    peekitem = levels.peekitem
+    j = 0
+    while j < len(levels):
+        price, level = peekitem(j)
+        if not crosses(price):
+            break
+        i = 0
+        while i < len(level):
+            order = level[i]
+            if order.id in excluded:
+                i += 1
+                continue
+            yield order
+            # Step past the order unless the caller removed it
+            if i < len(level) and level[i] is order:
+                i += 1
+        # Step past the level unless it was emptied and dropped
+        if j < len(levels) and peekitem(j)[1] is level:
+            j += 1
+
 
 class OrderBook:
     """
     Price-time priority order book.
 
-    - Bids (buy orders): sorted by price descending, then time ascending
-    - Asks (sell orders): sorted by price ascending, then time ascending
+    Orders are grouped into price levels, each a FIFO queue in arrival
+    order. Levels are kept sorted so the best price is always first:
+
+    - Bids (buy orders): levels by price descending
+    - Asks (sell orders): levels by price ascending
 
     Best bid = highest price buyer
     Best ask = lowest price seller
+
+    Not thread-safe: the book is only used from the event loop.
     """
 
     def __init__(self) -> None:
-        self._lock = RLock()
         self._orders: dict[str, Order] = {}  # order_id -> Order
+        # address -> {order_id -> Order}, for per-user lookups
+        self._user_orders: dict[str, dict[str, Order]] = {}
 
-        # Bids: highest price first, earliest time first at same price
-        # Key: (-price, created_at, order_id) for descending price sort
-        self._bids: SortedList[Order] = SortedList(
-            key=lambda o: (-o.price, o.created_at, o.id)
-        )
-
-        # Asks: lowest price first, earliest time first at same price
-        # Key: (price, created_at, order_id) for ascending price sort
-        self._asks: SortedList[Order] = SortedList(
-            key=lambda o: (o.price, o.created_at, o.id)
-        )
+        # price -> FIFO of orders at that price, best price first
+        self._bid_levels: SortedDict[Decimal, deque[Order]] = SortedDict(neg)
+        self._ask_levels: SortedDict[Decimal, deque[Order]] = SortedDict()
+        self._bid_count = 0
+        self._ask_count = 0
 
     def add(self, order: Order) -> None:
-        """Add an order to the book."""
-        with self._lock:
-            if order.id in self._orders:
-                raise ValueError(f"Order already exists: {order.id}")
+        """Add an order to the back of its price level."""
+        if order.id in self._orders:
+            raise ValueError(f"Order already exists: {order.id}")
 
-            self._orders[order.id] = order
+        self._orders[order.id] = order
+        self._user_orders.setdefault(order.user_address, {})[order.id] = order
 
-            if order.side == OrderSide.BUY:
-                self._bids.add(order)
-            else:
-                self._asks.add(order)
+        if order.side is _BUY:
+            levels = self._bid_levels
+            self._bid_count += 1
+        else:
+            levels = self._ask_levels
+            self._ask_count += 1
+
+        level = levels.get(order.price)
+        if level is None:
+            levels[order.price] = level = deque()
+        level.append(order)
 
     def remove(self, order_id: str) -> Optional[Order]:
         """Remove an order from the book. Returns the order or None if not found."""
-        with self._lock:
-            order = self._orders.pop(order_id, None)
-            if order is None:
-                return None
-
-            if order.side == OrderSide.BUY:
-                self._bids.discard(order)
-            else:
-                self._asks.discard(order)
+        order = self._orders.pop(order_id, None)
+        if order is None:
+            return None
+
+        user_orders = self._user_orders[order.user_address]
+        del user_orders[order.id]
+        if not user_orders:
+            del self._user_orders[order.user_address]
+
+        if order.side is _BUY:
+            levels = self._bid_levels
+            self._bid_count -= 1
+        else:
+            levels = self._ask_levels
+            self._ask_count -= 1
+
+        level = levels[order.price]
+        if level[0] is order:
+            # Fills consume the front of the level
+            level.popleft()
+        else:
+            for i, queued in enumerate(level):
+                if queued is order:
+                    del level[i]
+                    break
+        if not level:
+            del levels[order.price]
 
-            return order
+        return order
 
     def get(self, order_id: str) -> Optional[Order]:
         """Get an order by ID."""
-        with self._lock:
-            return self._orders.get(order_id)
+        return self._orders.get(order_id)
 
     def get_best_bid(self) -> Optional[Order]:
         """Get the best (highest price) bid."""
-        with self._lock:
-            return self._bids[0] if self._bids else None
+        return self._bid_levels.peekitem(0)[1][0] if self._bid_levels else None
 
     def get_best_ask(self) -> Optional[Order]:
         """Get the best (lowest price) ask."""
-        with self._lock:
-            return self._asks[0] if self._asks else None
+        return self._ask_levels.peekitem(0)[1][0] if self._ask_levels else None
 
     def get_bids(self) -> list[Order]:
-        """Get all bids in price-time priority order."""
-        with self._lock:
-            return list(self._bids)
+        """Get all bids in price-time priority order. Copies the whole side."""
+        return [order for level in self._bid_levels.values() for order in level]
 
     def get_asks(self) -> list[Order]:
-        """Get all asks in price-time priority order."""
-        with self._lock:
-            return list(self._asks)
-
-    def iter_matching_asks(self, max_price: Decimal) -> Iterator[Order]:
+        """Get all asks in price-time priority order. Copies the whole side."""
+        return [order for level in self._ask_levels.values() for order in level]
+
+    def get_top_bids(self, k: int = 10) -> list[Order]:
+        """Get the first k bids in price-time priority order."""
+        return list(islice(chain.from_iterable(self._bid_levels.values()), k))
+
+    def get_top_asks(self, k: int = 10) -> list[Order]:
+        """Get the first k asks in price-time priority order."""
+        return list(islice(chain.from_iterable(self._ask_levels.values()), k))
+
+    def iter_matching_asks(
+        self,
+        max_price: Decimal,
+        exclude_user: Optional[str] = None,
+    ) -> Iterator[Order]:
         """
         Iterate asks that could match a buy order at the given price.
-        Yields asks with price <= max_price in price-time priority.
+        Yields asks with price <= max_price in price-time priority,
+        skipping orders placed by exclude_user.
+
+        The yielded order may be removed from the book before advancing.
         """
-        with self._lock:
-            for order in self._asks:
-                if order.price <= max_price:
-                    yield order
-                else:
-                    break
+        excluded = self._user_orders.get(exclude_user, {})
+        yield from _iter_levels(
+            self._ask_levels, lambda price: price <= max_price, excluded
+        )
 
-    def iter_matching_bids(self, min_price: Decimal) -> Iterator[Order]:
+    def iter_matching_bids(
+        self,
+        min_price: Decimal,
+        exclude_user: Optional[str] = None,
+    ) -> Iterator[Order]:
         """
         Iterate bids that could match a sell order at the given price.
-        Yields bids with price >= min_price in price-time priority.
+        Yields bids with price >= min_price in price-time priority,
+        skipping orders placed by exclude_user.
+
+        The yielded order may be removed from the book before advancing.
         """
-        with self._lock:
-            for order in self._bids:
-                if order.price >= min_price:
-                    yield order
-                else:
-                    break
+        excluded = self._user_orders.get(exclude_user, {})
+        yield from _iter_levels(
+            self._bid_levels, lambda price: price >= min_price, excluded
+        )
 
     def get_user_orders(self, address: str) -> list[Order]:
         """Get all orders for a specific user."""
-        with self._lock:
-            return [o for o in self._orders.values() if o.user_address == address]
+        return list(self._user_orders.get(address, {}).values())
 
     @property
     def bid_count(self) -> int:
         """Number of bids in the book."""
-        with self._lock:
-            return len(self._bids)
+        return self._bid_count
 
     @property
     def ask_count(self) -> int:
         """Number of asks in the book."""
-        with self._lock:
-            return len(self._asks)
+        return self._ask_count
 
     @property
     def order_count(self) -> int:
         """Total number of orders in the book."""
-        with self._lock:
-            return len(self._orders)
+        return len(self._orders)
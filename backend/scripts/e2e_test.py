@@ -2,6 +2,7 @@
 """End-to-end test for Lumen Dark on testnet."""
 
 import asyncio
+import functools
 import hashlib
 import subprocess
 import time
@@ -18,9 +19,13 @@ TOKEN_B_CONTRACT = "CDRASGTVJWOQTWCXNXD2YHIHHK2BHUONJMQHHWE25HQMFONWBL4XCYE3"
 # Backend API (will be started separately)
 API_BASE_URL = "http://localhost:8000"
 
+# Hash of an empty body, for signing GET requests
+EMPTY_BODY_HASH = hashlib.sha256(b"").hexdigest()
 
+
+@functools.lru_cache(maxsize=None)
 def get_keypair(alias: str) -> Keypair:
-    """Get keypair from stellar CLI."""
+    """Get keypair from stellar CLI. Cached, since aliases are fixed for a run."""
     result = subprocess.run(
         ["stellar", "keys", "show", alias],
         capture_output=True,
@@ -30,8 +35,9 @@ def get_keypair(alias: str) -> Keypair:
     return Keypair.from_secret(secret)
 
 
+@functools.lru_cache(maxsize=None)
 def get_address(alias: str) -> str:
-    """Get public address from stellar CLI."""
+    """Get public address from stellar CLI. Cached, since aliases are fixed for a run."""
     result = subprocess.run(
         ["stellar", "keys", "address", alias],
         capture_output=True,
@@ -105,7 +111,7 @@ def check_balance(user_alias: str, asset: str) -> int:
 def sign_request(keypair: Keypair, method: str, path: str, body: bytes) -> dict:
     """Sign a request for the API."""
     timestamp = int(time.time())
-    body_hash = hashlib.sha256(body).hexdigest()
+    body_hash = hashlib.sha256(body).hexdigest() if body else EMPTY_BODY_HASH
     message = f"{method}|{path}|{body_hash}|{timestamp}"
     message_bytes = message.encode("utf-8")
 
@@ -133,20 +139,21 @@ async def test_deposit_flow():
         print(f"  User1 Token A balance: 0 (not set)")
         bal_a = 0
 
-    # User1 deposits Token A
-    print("\n1. User1 deposits 1000 Token A...")
-    deposit_to_orderbook("user1", "a", 1000_0000000)  # 1000 with 7 decimals
+    # The two users sign with different accounts, so their deposits and
+    # balance checks are independent and can run side by side
+    print("\n1. User1 deposits 1000 Token A, User2 deposits 5000 Token B...")
+    await asyncio.gather(
+        asyncio.to_thread(deposit_to_orderbook, "user1", "a", 1000_0000000),  # 1000 with 7 decimals
+        asyncio.to_thread(deposit_to_orderbook, "user2", "b", 5000_0000000),
+    )
 
-    # Check balance after deposit
-    bal_a_after = check_balance("user1", "a")
+    # Check balances after deposit
+    bal_a_after, bal_b = await asyncio.gather(
+        asyncio.to_thread(check_balance, "user1", "a"),
+        asyncio.to_thread(check_balance, "user2", "b"),
+    )
     print(f"  User1 Token A balance after: {bal_a_after}")
     assert bal_a_after == 1000_0000000, f"Expected 1000_0000000, got {bal_a_after}"
-
-    # User2 deposits Token B
-    print("\n2. User2 deposits 5000 Token B...")
-    deposit_to_orderbook("user2", "b", 5000_0000000)
-
-    bal_b = check_balance("user2", "b")
     print(f"  User2 Token B balance: {bal_b}")
     assert bal_b == 5000_0000000, f"Expected 5000_0000000, got {bal_b}"
 
@@ -163,7 +170,7 @@ async def test_order_matching():
     print("\nNote: Full order matching E2E requires running the backend server")
     print("with deposit event listener connected to testnet.")
     print("\nTo run the full test:")
-    print("  1. Start the backend: uvicorn lumendark.api.app:app --reload")
+    print("  1. Start the backend: uvicorn --factory lumendark.api.app:get_app --reload")
     print("  2. Deposits on-chain will be detected and credited")
     print("  3. Users can then place orders via the API")
 
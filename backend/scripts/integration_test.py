@@ -33,6 +33,7 @@ from typing import Optional
 
 import httpx
 from stellar_sdk import (
+    Account,
     Asset,
     Keypair,
     Network,
@@ -40,6 +41,7 @@ from stellar_sdk import (
     SorobanServer,
     TransactionBuilder,
     scval,
+    xdr,
 )
 from stellar_sdk.soroban_rpc import GetTransactionStatus
 
@@ -47,7 +49,7 @@ from stellar_sdk.soroban_rpc import GetTransactionStatus
 sys.path.insert(0, "/Users/tomer/dev/lumendark/client")
 sys.path.insert(0, "/Users/tomer/dev/lumendark/backend")
 
-from lumendark_client import LumenDarkClient
+from lumendark_client import LumenDarkClient, StatusResponse
 
 
 # =============================================================================
@@ -535,7 +537,8 @@ def start_backend_server(admin_secret: str, orderbook_contract: str) -> subproce
 
     cmd = [
         sys.executable, "-m", "uvicorn",
-        "lumendark.api.app:app",
+        "--factory", "lumendark.api.app:get_app",
+        "--loop", "uvloop",
         "--host", "0.0.0.0",
         "--port", str(API_PORT),
         "--log-level", "info",
@@ -616,6 +619,27 @@ def deposit_to_orderbook(
     print(f"    Deposit confirmed")
 
 
+def get_token_balance(server: SorobanServer, token_contract: str, address: str) -> int:
+    """Read an address's token balance by simulating the token's balance()."""
+    # Simulation never submits, so any source account and sequence will do
+    builder = TransactionBuilder(
+        source_account=Account(address, 0),
+        network_passphrase=NETWORK.network_passphrase,
+        base_fee=100,
+    )
+    builder.append_invoke_contract_function_op(
+        contract_id=token_contract,
+        function_name="balance",
+        parameters=[scval.to_address(address)],
+    )
+    builder.set_timeout(30)
+
+    sim_response = server.simulate_transaction(builder.build())
+    if sim_response.error:
+        raise RuntimeError(f"Balance query failed: {sim_response.error}")
+    return scval.from_int128(xdr.SCVal.from_xdr(sim_response.results[0].xdr))
+
+
 async def setup_deposits(
     accounts: TestAccounts,
     contracts: DeployedContracts,
@@ -644,17 +668,48 @@ async def setup_deposits(
 # TESTS
 # =============================================================================
 
-async def test_health_check(results: TestResult):
-    """Test API health endpoint."""
-    async with httpx.AsyncClient() as client:
+async def wait_for_status(
+    client: LumenDarkClient,
+    msg_id: str,
+    timeout: float = 20.0,
+    initial_delay: float = 0.1,
+    max_delay: float = 2.0,
+) -> StatusResponse:
+    """
+    Poll a message's status until it leaves pending, with capped exponential
+    backoff. Transient request errors are retried until the deadline.
+
+    Returns the final status, or the last pending one once the timeout
+    passes. Re-raises the last request error if no status was ever read.
+    """
+    deadline = time.monotonic() + timeout
+    delay = initial_delay
+    status: Optional[StatusResponse] = None
+    while True:
         try:
-            response = await client.get(f"{API_BASE_URL}/health")
-            if response.status_code == 200 and response.json()["status"] == "healthy":
-                results.success("Health check")
-            else:
-                results.failure("Health check", f"Unexpected response: {response.text}")
+            status = await client.get_status(msg_id)
+            if not status.is_pending:
+                return status
         except Exception as e:
-            results.failure("Health check", str(e))
+            if time.monotonic() >= deadline and status is None:
+                raise
+            print(f"    Retrying status check after error: {type(e).__name__}")
+        if time.monotonic() >= deadline:
+            return status
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, max_delay)
+
+
+async def test_health_check(results: TestResult, http: httpx.AsyncClient):
+    """Test API health endpoint."""
+    try:
+        response = await http.get(f"{API_BASE_URL}/health")
+        if response.status_code == 200 and response.json()["status"] == "healthy":
+            results.success("Health check")
+        else:
+            results.failure("Health check", f"Unexpected response: {response.text}")
+    except Exception as e:
+        results.failure("Health check", str(e))
 
 
 async def test_order_placement(
@@ -678,9 +733,7 @@ async def test_order_placement(
         )
         results.success(f"User1 SELL order submitted (msg_id: {sell_msg_id})")
 
-        await asyncio.sleep(2)
-
-        status = await user1_client.get_status(sell_msg_id)
+        status = await wait_for_status(user1_client, sell_msg_id)
         if status.is_accepted:
             results.success(f"User1 SELL order accepted (order_id: {status.order_id})")
         else:
@@ -700,25 +753,13 @@ async def test_order_placement(
         )
         results.success(f"User2 BUY order submitted (msg_id: {buy_msg_id})")
 
-        # Wait for matching and settlement
-        print("  Waiting for order matching and settlement...")
-        await asyncio.sleep(15)
-
-        # Retry status check a few times in case of transient connection issues
-        for attempt in range(3):
-            try:
-                status = await user2_client.get_status(buy_msg_id)
-                if status.is_accepted:
-                    results.success("User2 BUY order matched")
-                else:
-                    results.failure("User2 BUY order status", f"Got {status.status}")
-                break
-            except Exception as e:
-                if attempt == 2:
-                    results.failure("User2 BUY order", f"{type(e).__name__}: {e}")
-                else:
-                    print(f"    Retry {attempt + 1}/3 after error: {type(e).__name__}")
-                    await asyncio.sleep(2)
+        # Wait for matching
+        print("  Waiting for order matching...")
+        status = await wait_for_status(user2_client, buy_msg_id, timeout=15)
+        if status.is_accepted:
+            results.success("User2 BUY order matched")
+        else:
+            results.failure("User2 BUY order status", f"Got {status.status}")
 
     except Exception as e:
         results.failure("User2 BUY order", f"{type(e).__name__}: {e}")
@@ -737,9 +778,7 @@ async def test_order_cancellation(results: TestResult, user1_client: LumenDarkCl
             price="10",
             quantity="25",
         )
-        await asyncio.sleep(2)
-
-        status = await user1_client.get_status(msg_id)
+        status = await wait_for_status(user1_client, msg_id)
         order_id = status.order_id
 
         if not order_id:
@@ -751,9 +790,7 @@ async def test_order_cancellation(results: TestResult, user1_client: LumenDarkCl
         # Cancel the order
         print(f"  Cancelling order {order_id}...")
         cancel_msg_id = await user1_client.cancel_order(order_id)
-        await asyncio.sleep(2)
-
-        cancel_status = await user1_client.get_status(cancel_msg_id)
+        cancel_status = await wait_for_status(user1_client, cancel_msg_id)
         if cancel_status.is_accepted:
             results.success("Order cancelled successfully")
         else:
@@ -763,13 +800,28 @@ async def test_order_cancellation(results: TestResult, user1_client: LumenDarkCl
         results.failure("Order cancellation", str(e))
 
 
-async def test_withdrawal(results: TestResult, user1_client: LumenDarkClient):
-    """Test withdrawal flow."""
+async def test_withdrawal(
+    results: TestResult,
+    user1_client: LumenDarkClient,
+    user1: Keypair,
+    contracts: DeployedContracts,
+    onchain_timeout: float = 120.0,
+):
+    """
+    Test withdrawal flow, through to the tokens arriving in the user's wallet.
+
+    Actions are submitted in order and this withdrawal is queued after
+    every settlement from the order tests, so seeing it land on-chain also
+    means the settlements went through before the server is stopped.
+    """
     print("\n--- Testing Withdrawal ---")
 
     withdraw_amount = 50_0000000  # 50 Token A
+    server = SorobanServer(NETWORK.soroban_rpc_url)
 
     try:
+        wallet_before = get_token_balance(server, contracts.token_a, user1.public_key)
+
         print(f"  Requesting withdrawal of 50 Token A...")
         msg_id = await user1_client.request_withdrawal(
             asset="a",
@@ -777,15 +829,32 @@ async def test_withdrawal(results: TestResult, user1_client: LumenDarkClient):
         )
         results.success(f"Withdrawal requested (msg_id: {msg_id})")
 
-        # Wait for on-chain withdrawal
-        print("  Waiting for on-chain withdrawal...")
-        await asyncio.sleep(20)
-
-        status = await user1_client.get_status(msg_id)
+        # Wait for the withdrawal to be processed
+        print("  Waiting for withdrawal processing...")
+        status = await wait_for_status(user1_client, msg_id, timeout=20)
         if status.is_accepted:
             results.success("Withdrawal accepted")
         else:
             results.failure("Withdrawal status", f"Got {status.status}")
+            return
+
+        # Only deposits and withdrawals move wallet tokens, so the wallet
+        # grows by exactly the withdrawal once it is applied on-chain
+        print("  Waiting for on-chain withdrawal...")
+        expected = wallet_before + withdraw_amount
+        deadline = time.monotonic() + onchain_timeout
+        wallet = wallet_before
+        while wallet != expected and time.monotonic() < deadline:
+            await asyncio.sleep(2)
+            wallet = get_token_balance(server, contracts.token_a, user1.public_key)
+
+        if wallet == expected:
+            results.success("Withdrawal applied on-chain")
+        else:
+            results.failure(
+                "On-chain withdrawal",
+                f"Wallet balance {wallet}, expected {expected}",
+            )
 
     except Exception as e:
         results.failure("Withdrawal", str(e))
@@ -810,13 +879,10 @@ async def test_multiple_orders(
             sell_orders.append(msg_id)
             print(f"  Placed SELL order {i+1}: 10 @ {price}")
 
-        await asyncio.sleep(3)
-
-        accepted = 0
-        for msg_id in sell_orders:
-            status = await user1_client.get_status(msg_id)
-            if status.is_accepted:
-                accepted += 1
+        statuses = await asyncio.gather(
+            *(wait_for_status(user1_client, msg_id) for msg_id in sell_orders)
+        )
+        accepted = sum(status.is_accepted for status in statuses)
 
         if accepted == len(sell_orders):
             results.success(f"All {len(sell_orders)} SELL orders accepted")
@@ -828,30 +894,18 @@ async def test_multiple_orders(
 
     # Place a buy order that matches some
     try:
-        print("  Placing BUY order: 25 @ 7 (should match 2 orders)...")
+        print("  Placing BUY order: 25 @ 7 (crosses any resting asks at or below 7)...")
         msg_id = await user2_client.submit_order(
             side="buy",
             price="7",
             quantity="25",
         )
 
-        await asyncio.sleep(15)
-
-        # Retry status check a few times in case of transient connection issues
-        for attempt in range(3):
-            try:
-                status = await user2_client.get_status(msg_id)
-                if status.is_accepted:
-                    results.success("Partial fill BUY order processed")
-                else:
-                    results.failure("Partial fill BUY order", f"Got {status.status}")
-                break
-            except Exception as e:
-                if attempt == 2:
-                    results.failure("Partial fill BUY order", f"{type(e).__name__}: {e}")
-                else:
-                    print(f"    Retry {attempt + 1}/3 after error: {type(e).__name__}")
-                    await asyncio.sleep(2)
+        status = await wait_for_status(user2_client, msg_id, timeout=15)
+        if status.is_accepted:
+            results.success("Partial fill BUY order processed")
+        else:
+            results.failure("Partial fill BUY order", f"Got {status.status}")
 
     except Exception as e:
         results.failure("Partial fill BUY order", f"{type(e).__name__}: {e}")
@@ -869,9 +923,7 @@ async def test_insufficient_balance(results: TestResult, user1_client: LumenDark
             quantity="999999999",
         )
 
-        await asyncio.sleep(2)
-
-        status = await user1_client.get_status(msg_id)
+        status = await wait_for_status(user1_client, msg_id)
         if status.is_rejected:
             results.success("Order correctly rejected for insufficient balance")
         else:
@@ -923,6 +975,8 @@ async def main():
 
     results = TestResult()
     server_process = None
+    # One connection pool shared by the health check and both users' clients
+    http = httpx.AsyncClient(timeout=30.0)
 
     try:
         # Step 1: Create and fund accounts
@@ -953,23 +1007,30 @@ async def main():
         user1_client = LumenDarkClient(
             base_url=API_BASE_URL,
             keypair=accounts.user1,
+            http_client=http,
         )
         user2_client = LumenDarkClient(
             base_url=API_BASE_URL,
             keypair=accounts.user2,
+            http_client=http,
         )
 
         print("\n" + "=" * 60)
         print("RUNNING TESTS")
         print("=" * 60)
 
-        # Step 6: Run tests
-        await test_health_check(results)
-        await test_order_placement(results, user1_client, user2_client)
-        await test_order_cancellation(results, user1_client)
-        await test_multiple_orders(results, user1_client, user2_client)
-        await test_withdrawal(results, user1_client)
-        await test_insufficient_balance(results, user1_client)
+        # Step 6: Run tests. The order tests fit within the deposits
+        # together and only assert acceptance, which does not depend on
+        # which resting orders a buy matches, so they run concurrently.
+        # The withdrawal runs once they have allocated user1's balance.
+        await test_health_check(results, http)
+        await asyncio.gather(
+            test_order_placement(results, user1_client, user2_client),
+            test_order_cancellation(results, user1_client),
+            test_multiple_orders(results, user1_client, user2_client),
+            test_insufficient_balance(results, user1_client),
+        )
+        await test_withdrawal(results, user1_client, accounts.user1, contracts)
 
     except KeyboardInterrupt:
         print("\n\nTest interrupted by user")
@@ -979,6 +1040,8 @@ async def main():
         traceback.print_exc()
         return 1
     finally:
+        await http.aclose()
+
         # Cleanup: stop server
         if server_process:
             print("\n--- Cleanup ---")
@@ -5,17 +5,23 @@ import hashlib
 import time
 from decimal import Decimal
 
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 from stellar_sdk import Keypair
 
 from lumendark.api.app import create_app
+from lumendark.api.auth import create_sign_message
+from lumendark.api.ratelimit import TokenBucket
 from lumendark.storage.user_store import UserStore
 from lumendark.storage.order_book import OrderBook
 from lumendark.storage.message_store import MessageStore
 from lumendark.queues.message_queue import MessageQueue
 from lumendark.queues.action_queue import ActionQueue
 
+# A valid order request body
+ORDER_BODY = b'{"side": "buy", "price": "10", "quantity": "100"}'
+
 
 def sign_request(
     keypair: Keypair,
@@ -35,6 +41,26 @@ def sign_request(
     return keypair.public_key, signature_hex, str(timestamp)
 
 
+def post_signed(
+    client: TestClient,
+    keypair: Keypair,
+    path: str,
+    body: bytes,
+) -> httpx.Response:
+    """Sign and POST a JSON body as the given keypair."""
+    address, signature, timestamp = sign_request(keypair, "POST", path, body)
+    return client.post(
+        path,
+        content=body,
+        headers={
+            "X-Stellar-Address": address,
+            "X-Stellar-Signature": signature,
+            "X-Timestamp": timestamp,
+            "Content-Type": "application/json",
+        },
+    )
+
+
 @pytest.fixture
 def user_keypair() -> Keypair:
     return Keypair.random()
@@ -90,6 +116,45 @@ def client(app) -> TestClient:
         yield client
 
 
+class TestSignMessage:
+    """Signing message format tests."""
+
+    def test_create_sign_message_matches_client_format(self) -> None:
+        body = b'{"side": "buy", "price": "10", "quantity": "100"}'
+        body_hash = hashlib.sha256(body).hexdigest()
+        expected = f"POST|/orders|{body_hash}|1700000000".encode("utf-8")
+
+        assert create_sign_message("POST", "/orders", body, 1700000000) == expected
+
+
+class TestTokenBucket:
+    """Per-user rate limiter tests."""
+
+    def test_allows_burst_then_limits(self) -> None:
+        bucket = TokenBucket(rate=1.0, capacity=2, clock=lambda: 0.0)
+
+        assert bucket.try_acquire("user1")
+        assert bucket.try_acquire("user1")
+        assert not bucket.try_acquire("user1")
+        assert bucket.try_acquire("user2")  # Other users are unaffected
+
+    def test_refills_over_time(self) -> None:
+        now = [0.0]
+        bucket = TokenBucket(rate=1.0, capacity=1, clock=lambda: now[0])
+
+        assert bucket.try_acquire("user1")
+        assert not bucket.try_acquire("user1")
+        now[0] = 1.0
+        assert bucket.try_acquire("user1")
+
+    def test_evicts_least_recently_used_key(self) -> None:
+        bucket = TokenBucket(rate=0.0, capacity=1, max_keys=1, clock=lambda: 0.0)
+
+        assert bucket.try_acquire("user1")
+        assert bucket.try_acquire("user2")  # Evicts user1
+        assert bucket.try_acquire("user1")  # Starts with a full bucket again
+
+
 class TestHealthCheck:
     """Health check endpoint tests."""
 
@@ -191,6 +256,17 @@ class TestOrderEndpoints:
 
         assert response.status_code == 422  # Validation error
 
+    def test_submit_order_unknown_field_rejected(
+        self,
+        client: TestClient,
+        user_keypair: Keypair,
+    ) -> None:
+        """Submit order with an unexpected field should be rejected."""
+        body = b'{"side": "buy", "price": "10", "quantity": "100", "hidden": true}'
+        response = post_signed(client, user_keypair, "/orders", body)
+
+        assert response.status_code == 422
+
     def test_submit_order_without_auth_rejected(
         self,
         client: TestClient,
@@ -230,6 +306,64 @@ class TestOrderEndpoints:
 
         assert response.status_code == 401
 
+    def test_submit_order_queue_full_returns_503(
+        self,
+        user_store: UserStore,
+        order_book: OrderBook,
+        message_store: MessageStore,
+        action_queue: ActionQueue,
+        user_keypair: Keypair,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Submit order should be shed with 503 when the queue stays full."""
+        monkeypatch.setattr("lumendark.api.routes.orders.QUEUE_PUT_TIMEOUT", 0.01)
+        app = create_app(
+            user_store=user_store,
+            order_book=order_book,
+            message_store=message_store,
+            message_queue=MessageQueue(maxsize=1),
+            action_queue=action_queue,
+            run_handlers=False,
+        )
+
+        with TestClient(app) as client:
+            status_codes = [
+                post_signed(client, user_keypair, "/orders", ORDER_BODY).status_code
+                for _ in range(2)
+            ]
+
+        assert status_codes == [200, 503]
+        # The shed message was never acknowledged, so it is not kept
+        assert message_store.message_count == 1
+
+    def test_submit_order_rate_limited_returns_429(
+        self,
+        user_store: UserStore,
+        order_book: OrderBook,
+        message_store: MessageStore,
+        message_queue: MessageQueue,
+        action_queue: ActionQueue,
+        user_keypair: Keypair,
+    ) -> None:
+        """Submit order beyond the user's rate limit should return 429."""
+        app = create_app(
+            user_store=user_store,
+            order_book=order_book,
+            message_store=message_store,
+            message_queue=message_queue,
+            action_queue=action_queue,
+            rate_limiter=TokenBucket(rate=0.0, capacity=1),
+            run_handlers=False,
+        )
+
+        with TestClient(app) as client:
+            status_codes = [
+                post_signed(client, user_keypair, "/orders", ORDER_BODY).status_code
+                for _ in range(2)
+            ]
+
+        assert status_codes == [200, 429]
+
     def test_cancel_order_returns_message_id(
         self,
         client: TestClient,
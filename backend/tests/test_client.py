@@ -0,0 +1,22 @@
+"""Soroban client tests."""
+
+import time
+
+import pytest
+
+from lumendark.blockchain.client import SorobanClient
+
+
+class TestRpc:
+    async def test_returns_result(self) -> None:
+        client = SorobanClient(rpc_timeout=1.0)
+        assert await client.rpc(lambda x, y=0: x + y, 1, y=2) == 3
+
+    async def test_times_out_stalled_call(self) -> None:
+        client = SorobanClient(rpc_timeout=0.05)
+
+        def stalled() -> None:
+            time.sleep(0.2)
+
+        with pytest.raises(TimeoutError, match="stalled"):
+            await client.rpc(stalled)
@@ -0,0 +1,100 @@
+"""Deposit event listener tests."""
+
+from stellar_sdk import Keypair, scval
+
+from lumendark.blockchain.event_listener import (
+    DEPOSIT_TOPIC_FILTERS,
+    MAX_POLL_INTERVAL,
+    DepositEventListener,
+    decode_deposit_event,
+    parse_scval_string,
+)
+
+
+def make_deposit_event(user: str, asset: str = "A", amount: int = 1000) -> dict:
+    return {
+        "topic": [
+            scval.to_symbol("deposit").to_xdr(),
+            scval.to_address(user).to_xdr(),
+        ],
+        "value": scval.to_vec(
+            [scval.to_enum(asset, None), scval.to_int128(amount)]
+        ).to_xdr(),
+        "ledger": 42,
+        "tx_hash": "abc123",
+    }
+
+
+class TestParseScvalString:
+    def test_symbol(self) -> None:
+        assert parse_scval_string(scval.to_symbol("deposit")) == "deposit"
+
+    def test_address(self) -> None:
+        kp = Keypair.random()
+        assert parse_scval_string(scval.to_address(kp.public_key)) == kp.public_key
+
+    def test_i128(self) -> None:
+        assert parse_scval_string(scval.to_int128(2**70 + 5)) == str(2**70 + 5)
+
+    def test_negative_i128(self) -> None:
+        value = -(2**100) + 3
+        assert parse_scval_string(scval.to_int128(value)) == str(value)
+
+    def test_vec(self) -> None:
+        val = scval.to_vec([scval.to_enum("A", None), scval.to_int128(1000)])
+        assert parse_scval_string(val) == "[['A'], 1000]"
+
+
+class TestDecodeDepositEvent:
+    def test_decodes_deposit(self) -> None:
+        kp = Keypair.random()
+        decoded = decode_deposit_event(make_deposit_event(kp.public_key, "B", 2500))
+
+        assert decoded == {
+            "user_address": kp.public_key,
+            "asset": "b",
+            "amount": "2500",
+            "ledger": 42,
+            "tx_hash": "abc123",
+        }
+
+    def test_ignores_other_topics(self) -> None:
+        event = make_deposit_event(Keypair.random().public_key)
+        event["topic"][0] = scval.to_symbol("withdraw").to_xdr()
+
+        assert decode_deposit_event(event) is None
+
+
+class TestPollDelay:
+    def make_listener(self) -> DepositEventListener:
+        async def on_deposit(message) -> None:
+            pass
+
+        return DepositEventListener(
+            client=None, on_deposit=on_deposit, poll_interval=4.0
+        )
+
+    def test_polls_faster_while_events_arrive(self) -> None:
+        listener = self.make_listener()
+        assert listener._next_poll_delay(3) == 2.0
+
+    def test_backs_off_when_idle(self) -> None:
+        listener = self.make_listener()
+        delays = [listener._next_poll_delay(0) for _ in range(5)]
+        assert delays == [8.0, 16.0] + [MAX_POLL_INTERVAL] * 3
+
+    def test_resets_after_events(self) -> None:
+        listener = self.make_listener()
+        listener._next_poll_delay(0)
+        listener._next_poll_delay(0)
+        listener._next_poll_delay(1)
+        assert listener._next_poll_delay(0) == 8.0
+
+
+def test_deposit_topic_filter_matches_deposit_events() -> None:
+    event = make_deposit_event(Keypair.random().public_key)
+    (symbol, wildcard), = DEPOSIT_TOPIC_FILTERS
+
+    assert symbol == event["topic"][0]
+    assert wildcard == "*"
+    assert len(event["topic"]) == 2
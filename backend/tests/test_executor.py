@@ -1,8 +1,10 @@
+import asyncio
 from decimal import Decimal
 
 import pytest
 
 from lumendark.models.message import (
+    Action,
     Message,
     MessageType,
     MessageStatus,
@@ -14,6 +16,7 @@ from lumendark.storage.message_store import MessageStore
 from lumendark.queues.message_queue import MessageQueue
 from lumendark.queues.action_queue import ActionQueue
 from lumendark.executor.message_handler import MessageHandler
+from lumendark.executor.action_handler import ActionHandler, MockTransactionSubmitter
 
 
 @pytest.fixture
@@ -158,6 +161,13 @@ class TestOrderProcessing:
         assert user_store.get_available("buyer1", "b") == Decimal("500")
         assert user_store.get_liabilities("buyer1", "b") == Decimal("500")
 
+    def test_order_address_is_interned(self) -> None:
+        """Messages for the same user should share one address string."""
+        first = Message.create_order("".join(["buyer", "1"]), "buy", "50", "10")
+        second = Message.create_cancel("".join(["buyer", "1"]), "order-1")
+
+        assert first.user_address is second.user_address
+
     @pytest.mark.asyncio
     async def test_order_insufficient_balance_rejected(
         self,
@@ -202,6 +212,28 @@ class TestOrderProcessing:
         assert message.status == MessageStatus.REJECTED
         assert "not found" in str(message.rejection_reason)
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("price", ["abc", "Infinity", "NaN"])
+    async def test_order_invalid_price_rejected(
+        self,
+        message_handler: MessageHandler,
+        message_store: MessageStore,
+        price: str,
+    ) -> None:
+        """Order whose price is not a finite number should be rejected."""
+        message = Message.create_order(
+            user_address="user1",
+            side="buy",
+            price=price,
+            quantity="10",
+        )
+        message_store.add(message)
+
+        await message_handler._process_message(message)
+
+        assert message.status == MessageStatus.REJECTED
+        assert "Invalid order parameters" in str(message.rejection_reason)
+
     @pytest.mark.asyncio
     async def test_order_added_to_book(
         self,
@@ -461,3 +493,164 @@ class TestWithdrawProcessing:
         await message_handler._process_message(withdraw_msg2)
 
         assert withdraw_msg2.status == MessageStatus.ACCEPTED
+
+
+class TestHandlerLifecycle:
+    """Tests for starting and stopping the handler loop."""
+
+    @pytest.mark.asyncio
+    async def test_stop_interrupts_idle_handler(
+        self,
+        message_handler: MessageHandler,
+    ) -> None:
+        """Stopping an idle handler should end its loop without waiting for work."""
+        task = asyncio.create_task(message_handler.start())
+        await asyncio.sleep(0)
+
+        await message_handler.stop()
+
+        await asyncio.wait_for(task, timeout=0.5)
+        assert task.done()
+
+    @pytest.mark.asyncio
+    async def test_handler_processes_queued_message(
+        self,
+        message_handler: MessageHandler,
+        message_queue: MessageQueue,
+        user_store: UserStore,
+    ) -> None:
+        """Running handler should pick up queued messages."""
+        task = asyncio.create_task(message_handler.start())
+
+        message = Message.create_deposit(
+            user_address="user1",
+            asset="a",
+            amount="10",
+            ledger=1,
+            tx_hash="abc",
+        )
+        await message_queue.put(message)
+
+        async def wait_processed() -> None:
+            while message.status != MessageStatus.ACCEPTED:
+                await asyncio.sleep(0)
+
+        await asyncio.wait_for(wait_processed(), timeout=0.5)
+
+        await message_handler.stop()
+        await asyncio.wait_for(task, timeout=0.5)
+        assert user_store.get_available("user1", "a") == Decimal("10")
+
+    @pytest.mark.asyncio
+    async def test_action_handler_drains_batch_in_nonce_order(
+        self,
+        action_queue: ActionQueue,
+    ) -> None:
+        """Queued actions should be taken together and submitted in order."""
+        submitter = MockTransactionSubmitter()
+        handler = ActionHandler(action_queue, submitter)
+        actions = [
+            Action.create_withdrawal(user_address=f"user{i}", asset="a", amount="1")
+            for i in range(3)
+        ]
+        for action in actions:
+            await action_queue.put(action)
+
+        task = asyncio.create_task(handler.start())
+
+        async def wait_submitted() -> None:
+            while handler.nonce < 3:
+                await asyncio.sleep(0)
+
+        await asyncio.wait_for(wait_submitted(), timeout=0.5)
+        await handler.stop()
+        await asyncio.wait_for(task, timeout=0.5)
+
+        assert handler.nonce == 3
+        assert [a.tx_hash for a in actions] == [
+            "mock_withdraw_tx_1",
+            "mock_withdraw_tx_2",
+            "mock_withdraw_tx_3",
+        ]
+
+
+class TestMessageQueue:
+    """Tests for the message queue."""
+
+    @pytest.mark.asyncio
+    async def test_message_queue_get_many_drains_pending(
+        self,
+        message_queue: MessageQueue,
+    ) -> None:
+        """get_many should return everything queued, up to the limit, in order."""
+        messages = [
+            Message.create_deposit(
+                user_address="user1",
+                asset="a",
+                amount="1",
+                ledger=1,
+                tx_hash=f"tx{i}",
+            )
+            for i in range(3)
+        ]
+        for message in messages:
+            await message_queue.put(message)
+
+        assert await message_queue.get_many(2) == messages[:2]
+        assert await message_queue.get_many(2) == messages[2:]
+
+    @pytest.mark.asyncio
+    async def test_queue_timeouts_when_full_or_empty(self) -> None:
+        """Timed put and get should return instead of raising."""
+        queue = MessageQueue(maxsize=1)
+        message = Message.create_cancel(user_address="user1", order_id="o1")
+
+        assert await queue.put(message, timeout=0.01)
+        assert not await queue.put(message, timeout=0.01)
+        assert await queue.get(timeout=0.01) is message
+        assert await queue.get(timeout=0.01) is None
+
+
+class TestApplyFills:
+    """Tests for applying netted trade balance changes."""
+
+    def test_applies_consumed_and_credited(self, user_store: UserStore) -> None:
+        user_store.deposit("buyer", "b", Decimal("100"))
+        user_store.allocate("buyer", "b", Decimal("100"))
+
+        user_store.apply_fills(
+            {("buyer", "b"): Decimal("60")},
+            {("buyer", "a"): Decimal("6"), ("seller", "b"): Decimal("60")},
+        )
+
+        assert user_store.get_liabilities("buyer", "b") == Decimal("40")
+        assert user_store.get_available("buyer", "a") == Decimal("6")
+        assert user_store.get_available("seller", "b") == Decimal("60")
+
+    def test_insufficient_liability_changes_nothing(self, user_store: UserStore) -> None:
+        user_store.deposit("buyer", "b", Decimal("100"))
+        user_store.allocate("buyer", "b", Decimal("50"))
+        user_store.deposit("seller", "a", Decimal("5"))
+
+        with pytest.raises(ValueError, match="Insufficient liabilities"):
+            user_store.apply_fills(
+                {("buyer", "b"): Decimal("40"), ("seller", "a"): Decimal("5")},
+                {("buyer", "a"): Decimal("5")},
+            )
+
+        assert user_store.get_liabilities("buyer", "b") == Decimal("50")
+        assert user_store.get_available("buyer", "a") == Decimal("0")
+
+
+class TestUserStore:
+    """Tests for user balance operations."""
+
+    def test_try_allocate_insufficient_changes_nothing(self, user_store: UserStore) -> None:
+        user_store.deposit("buyer", "b", Decimal("100"))
+
+        assert not user_store.try_allocate("buyer", "b", Decimal("101"))
+        assert not user_store.try_allocate("nobody", "b", Decimal("1"))
+        assert user_store.try_allocate("buyer", "b", Decimal("100"))
+
+        assert user_store.get_available("buyer", "b") == Decimal("0")
+        assert user_store.get_liabilities("buyer", "b") == Decimal("100")
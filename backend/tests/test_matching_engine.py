@@ -271,3 +271,49 @@ class TestOrderBook:
 
         user2_orders = order_book.get_user_orders("user2")
         assert len(user2_orders) == 1
+
+    def test_iter_matching_allows_removal(self, order_book: OrderBook) -> None:
+        """Removing yielded orders mid-iteration should not skip any order."""
+        asks = [
+            Order.create(f"u{i}", OrderSide.SELL, Decimal(price), Decimal("100"))
+            for i, price in enumerate(["10.0", "10.5", "11.0", "12.0"])
+        ]
+        for ask in asks:
+            order_book.add(ask)
+
+        seen = []
+        for order in order_book.iter_matching_asks(Decimal("11.0")):
+            seen.append(order)
+            if order.price != Decimal("10.5"):
+                order_book.remove(order.id)
+
+        assert seen == asks[:3]
+        assert order_book.get_asks() == [asks[1], asks[3]]
+
+    def test_remove_keeps_level_fifo(self, order_book: OrderBook) -> None:
+        """Removing an order mid-level should keep the others in arrival order."""
+        bids = [
+            Order.create(f"u{i}", OrderSide.BUY, Decimal("10.0"), Decimal("100"))
+            for i in range(3)
+        ]
+        for bid in bids:
+            order_book.add(bid)
+        order_book.add(Order.create("u9", OrderSide.BUY, Decimal("9.0"), Decimal("100")))
+
+        order_book.remove(bids[1].id)
+
+        assert order_book.get_bids()[:2] == [bids[0], bids[2]]
+        assert order_book.bid_count == 3
+        assert list(order_book.iter_matching_bids(Decimal("10.0"))) == [bids[0], bids[2]]
+
+    def test_top_asks(self, order_book: OrderBook) -> None:
+        """Top asks should stop after k orders across price levels."""
+        asks = [
+            Order.create(f"u{i}", OrderSide.SELL, Decimal(price), Decimal("100"))
+            for i, price in enumerate(["10.0", "10.0", "10.5", "11.0"])
+        ]
+        for ask in reversed(asks):
+            order_book.add(ask)
+
+        assert order_book.get_top_asks(3) == [asks[1], asks[0], asks[2]]
+        assert order_book.get_top_bids() == []
@@ -68,6 +68,7 @@ class LumenDarkClient:
         base_url: str,
         keypair: Keypair,
         timeout: float = 30.0,
+        http_client: Optional[httpx.AsyncClient] = None,
     ) -> None:
         """
         Initialize the client.
@@ -76,15 +77,20 @@ class LumenDarkClient:
             base_url: Base URL of the Lumen Dark API
             keypair: Stellar keypair for signing requests
             timeout: Request timeout in seconds
+            http_client: Shared HTTP client whose connection pool to reuse.
+                The caller keeps ownership and closes it; when omitted the
+                client creates and closes its own.
         """
         self._base_url = base_url.rstrip("/")
         self._keypair = keypair
         self._timeout = timeout
-        self._client = httpx.AsyncClient(timeout=timeout)
+        self._owns_client = http_client is None
+        self._client = http_client or httpx.AsyncClient(timeout=timeout)
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        await self._client.aclose()
+        """Close the HTTP client, unless it was shared by the caller."""
+        if self._owns_client:
+            await self._client.aclose()
 
     async def __aenter__(self) -> "LumenDarkClient":
         return self